@@ -0,0 +1,34 @@
+# Generated by Django 5.2.8 on 2026-10-18 16:33
+
+import main.imaging
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='profile_image_height',
+            field=models.PositiveIntegerField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='profile_image_placeholder',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='profile_image_width',
+            field=models.PositiveIntegerField(editable=False, null=True),
+        ),
+        migrations.AlterField(
+            model_name='user',
+            name='profile_image',
+            field=main.imaging.ResponsiveImageField(blank=True, height_field='profile_image_height', null=True, placeholder_field='profile_image_placeholder', preset='avatar', upload_to='profile_images/', verbose_name='프로필 이미지', width_field='profile_image_width'),
+        ),
+    ]
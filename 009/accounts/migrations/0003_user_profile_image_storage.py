@@ -0,0 +1,20 @@
+# Generated by Django 5.2.8 on 2026-10-18 16:36
+
+import main.imaging
+import main.storage
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_user_profile_image_variants'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='profile_image',
+            field=main.imaging.ResponsiveImageField(blank=True, height_field='profile_image_height', null=True, placeholder_field='profile_image_placeholder', preset='avatar', storage=main.storage.upload_storage, upload_to='profile_images/', verbose_name='프로필 이미지', width_field='profile_image_width'),
+        ),
+    ]
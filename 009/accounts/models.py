@@ -2,14 +2,28 @@
 from django.contrib.auth.models import AbstractUser
 from django.db import models
 
+from main.imaging import ResponsiveImageField
+from main.storage import upload_storage
+
 
 class User(AbstractUser):
     nickname = models.CharField(
         max_length=50, blank=True, null=True, verbose_name="닉네임"
     )
-    profile_image = models.ImageField(
-        upload_to="profile_images/", blank=True, null=True, verbose_name="프로필 이미지"
+    profile_image = ResponsiveImageField(
+        upload_to="profile_images/",
+        storage=upload_storage,
+        blank=True,
+        null=True,
+        verbose_name="프로필 이미지",
+        preset="avatar",
+        width_field="profile_image_width",
+        height_field="profile_image_height",
+        placeholder_field="profile_image_placeholder",
     )
+    profile_image_width = models.PositiveIntegerField(null=True, editable=False)
+    profile_image_height = models.PositiveIntegerField(null=True, editable=False)
+    profile_image_placeholder = models.TextField(blank=True, editable=False)
     bio = models.TextField(blank=True, null=True, verbose_name="자기소개")
 
     class Meta:
@@ -5,11 +5,18 @@ from .models import Post, Tag, Comment
 
 @admin.register(Post)
 class PostAdmin(admin.ModelAdmin):
-    list_display = ["title", "author", "is_published", "view_count", "created_at"]
+    list_display = [
+        "title",
+        "author",
+        "is_published",
+        "view_count",
+        "like_count",
+        "created_at",
+    ]
     list_filter = ["is_published", "created_at", "tags"]
     search_fields = ["title", "content"]
     filter_horizontal = ["tags", "likes"]
-    readonly_fields = ["view_count", "created_at", "updated_at"]
+    readonly_fields = ["view_count", "like_count", "created_at", "updated_at"]
 
 
 @admin.register(Tag)
@@ -0,0 +1,228 @@
+# blog/counters.py
+"""조회수 write-behind 버퍼
+
+조회 요청마다 DB에 쓰지 않고 캐시에 증가분을 모아 두었다가,
+일정 시간 또는 일정 횟수마다 F() 업데이트로 한 번에 반영합니다.
+
+카운터 캐시가 프로세스 메모리(LocMemCache)에 있으면 버퍼는 웹 프로세스마다 따로
+있으므로 그 프로세스의 백그라운드 스레드만 플러시할 수 있습니다. 다른 프로세스에서
+플러시하는 flush_view_counts 명령과 작업은 Redis/Memcached 같은 공유 캐시가 필요합니다.
+
+여러 프로세스가 같은 버퍼를 다루므로, 플러시와 공유 dirty 목록 갱신은 각각
+cache.add()로 잡는 잠금 안에서 합니다. 조회 기록(incr)은 잠금 없이 원자적입니다.
+"""
+import atexit
+import logging
+import threading
+import time
+import uuid
+from collections import defaultdict
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from main.write_queue import write_queue
+
+# 값이 프로세스 안에만 있는 캐시 백엔드
+PROCESS_LOCAL_BACKENDS = {
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+}
+
+KEY_PREFIX = "blog:view_count:"
+DIRTY_KEY = "blog:view_count:dirty"
+# 공유 dirty 목록의 읽기-수정-쓰기를 감싸는 잠금
+DIRTY_LOCK_KEY = "blog:view_count:dirty_lock"
+# 한 번에 한 플러셔만 (읽은 증가분을 두 번 빼지 않도록)
+FLUSH_LOCK_KEY = "blog:view_count:flush_lock"
+# 잠금을 잡은 프로세스가 죽어도 풀리도록 하는 만료 시간(초)
+LOCK_TIMEOUT = 60
+
+logger = logging.getLogger(__name__)
+
+
+class ViewCountBuffer:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._dirty = set()
+        self._hits = 0
+        self._wakeup = threading.Event()
+        self._thread = None
+
+    @property
+    def cache(self):
+        return caches[getattr(settings, "BLOG_VIEW_COUNT_CACHE", "default")]
+
+    @property
+    def is_shared(self):
+        """다른 프로세스(관리 명령, 작업 워커)에서도 버퍼를 볼 수 있는지"""
+        alias = getattr(settings, "BLOG_VIEW_COUNT_CACHE", "default")
+        return settings.CACHES[alias]["BACKEND"] not in PROCESS_LOCAL_BACKENDS
+
+    @property
+    def flush_interval(self):
+        return getattr(settings, "BLOG_VIEW_COUNT_FLUSH_INTERVAL", 10)
+
+    @property
+    def flush_threshold(self):
+        return getattr(settings, "BLOG_VIEW_COUNT_FLUSH_THRESHOLD", 100)
+
+    def _key(self, pk):
+        return f"{KEY_PREFIX}{pk}"
+
+    def record(self, pk):
+        """조회 1회를 버퍼에 기록"""
+        self._incr(pk, 1)
+        with self._lock:
+            is_new = pk not in self._dirty
+            self._dirty.add(pk)
+            self._hits += 1
+            due = self._hits >= self.flush_threshold
+        if is_new:
+            # 다른 프로세스(관리 명령 등)도 플러시할 수 있도록 공유 캐시에 기록
+            # 잠금을 못 잡아도 이 프로세스의 dirty 목록에 있으므로 여기서 플러시됨
+            with self._cache_lock(DIRTY_LOCK_KEY, wait=0.1) as locked:
+                if locked:
+                    dirty = self.cache.get(DIRTY_KEY) or set()
+                    if pk not in dirty:
+                        self.cache.set(DIRTY_KEY, dirty | {pk}, timeout=None)
+        self._ensure_thread()
+        if due:
+            self._wakeup.set()
+
+    def pending(self, pk):
+        """아직 DB에 반영되지 않은 조회수"""
+        return self.cache.get(self._key(pk)) or 0
+
+    def flush(self):
+        """버퍼에 쌓인 조회수를 DB에 반영하고 반영한 조회수 합계를 반환
+
+        다른 프로세스가 플러시 중이면 아무것도 하지 않고 0을 반환합니다.
+        """
+        with self._cache_lock(FLUSH_LOCK_KEY) as locked:
+            if not locked:
+                return 0
+            return self._flush()
+
+    def _flush(self):
+        with self._lock:
+            pks = self._dirty
+            self._dirty = set()
+            self._hits = 0
+        with self._cache_lock(DIRTY_LOCK_KEY, wait=1) as locked:
+            # 못 잡으면 공유 목록은 다음 플러시에서 (이 프로세스 몫은 위에서 가져옴)
+            if locked:
+                pks |= self.cache.get(DIRTY_KEY) or set()
+                self.cache.delete(DIRTY_KEY)
+
+        # 플러시 잠금 안이므로 get과 incr(-count) 사이에 다른 플러셔가 끼어들지 않음
+        counts = {}
+        for pk in pks:
+            count = self.pending(pk)
+            if count:
+                # get 이후에 들어온 증가분은 캐시에 그대로 남습니다.
+                self._incr(pk, -count)
+                counts[pk] = count
+        if not counts:
+            return 0
+
+        try:
+            write_queue.run(apply_view_counts, counts)
+        except Exception:
+            # 반영에 실패하면 증가분을 되돌려 다음 플러시에 다시 시도
+            for pk, count in counts.items():
+                self._incr(pk, count)
+            with self._lock:
+                self._dirty.update(counts)
+            raise
+        return sum(counts.values())
+
+    @contextmanager
+    def _cache_lock(self, key, wait=0):
+        """cache.add()로 잡는 프로세스 간 잠금, 잡았는지 여부를 넘김
+
+        wait초 동안 다시 시도하고, 남이 잡은 잠금은 풀지 않도록 토큰을 확인합니다.
+        """
+        token = uuid.uuid4().hex
+        deadline = time.monotonic() + wait
+        locked = self.cache.add(key, token, timeout=LOCK_TIMEOUT)
+        while not locked and time.monotonic() < deadline:
+            time.sleep(0.01)
+            locked = self.cache.add(key, token, timeout=LOCK_TIMEOUT)
+        try:
+            yield locked
+        finally:
+            if locked and self.cache.get(key) == token:
+                self.cache.delete(key)
+
+    def _incr(self, pk, delta):
+        key = self._key(pk)
+        try:
+            self.cache.incr(key, delta)
+        except ValueError:
+            if not self.cache.add(key, delta, timeout=None):
+                self.cache.incr(key, delta)
+
+    def _ensure_thread(self):
+        """백그라운드 플러시 스레드를 (처음 한 번) 시작
+
+        flush_interval이 0이어도 임계값(flush_threshold)에 도달하면 플러시하도록 시작
+        """
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="blog-view-count-flusher", daemon=True
+            )
+            self._thread.start()
+        atexit.register(self._flush_quietly)
+
+    def _run(self):
+        from django.db import connection
+
+        while True:
+            # 주기가 0이면 임계값 도달(_wakeup)때만 플러시
+            self._wakeup.wait(self.flush_interval or None)
+            self._wakeup.clear()
+            self._flush_quietly()
+            connection.close()
+
+    def _flush_quietly(self):
+        try:
+            self.flush()
+        except Exception:
+            logger.exception("조회수 플러시 실패")
+
+
+def apply_view_counts(counts):
+    """{pk: 증가분}을 증가분별로 묶어 UPDATE ... SET view_count = view_count + n 실행"""
+    from .models import Post
+
+    by_count = defaultdict(list)
+    for pk, count in counts.items():
+        by_count[count].append(pk)
+    with transaction.atomic():
+        for count, pks in by_count.items():
+            Post.objects.filter(pk__in=pks).update(view_count=F("view_count") + count)
+
+
+view_counter = ViewCountBuffer()
+
+
+def recount_likes(queryset):
+    """queryset에 속한 게시글의 like_count를 좋아요 테이블 기준으로 다시 계산"""
+    from .models import Post
+
+    likes = (
+        Post.likes.through.objects.filter(post_id=OuterRef("pk"))
+        .values("post_id")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    return queryset.update(like_count=Coalesce(Subquery(likes), 0))
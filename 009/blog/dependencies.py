@@ -0,0 +1,24 @@
+# blog/dependencies.py
+"""블로그 캐시 항목이 의존하는 대상 이름 (main.cache_deps 참고)"""
+
+# 공개 게시글 목록의 구성/순서 (게시글 추가, 삭제, 공개 여부 변경)
+PUBLISHED_POSTS = "posts:published"
+# 공개 게시글 중 어느 하나의 내용이나 카운터 변경 (목록 페이지의 조건부 GET)
+POSTS = "posts"
+# 태그 이름/목록과 태그별 게시글 수 (태그 클라우드, 목록의 태그 배지)
+TAGS = "tags"
+
+
+def post(pk):
+    """게시글 한 개의 내용과 카운터(좋아요 등), 태그 연결"""
+    return f"post:{pk}"
+
+
+def comments(post_pk):
+    """게시글 한 개의 댓글 목록"""
+    return f"comments:{post_pk}"
+
+
+def tag(slug):
+    """태그 한 개에 속한 게시글 목록"""
+    return f"tag:{slug}"
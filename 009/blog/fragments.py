@@ -0,0 +1,18 @@
+# blog/fragments.py
+"""캐시된 블로그 페이지의 사용자별 영역(hole) 등록"""
+from django.shortcuts import get_object_or_404
+
+from main.fragments import register_hole
+
+from .models import Post
+
+
+def post_context(request, params):
+    post = get_object_or_404(Post, pk=params.get("post_id"), is_published=True)
+    return {"post": post, "is_liked": post.is_liked_by(request.user)}
+
+
+register_hole("post_create_button", "blog/fragments/post_create_button.html")
+register_hole("first_post_button", "blog/fragments/first_post_button.html")
+register_hole("post_actions", "blog/fragments/post_actions.html", post_context)
+register_hole("comment_form", "blog/fragments/comment_form.html", post_context)
@@ -0,0 +1,31 @@
+# blog/jobs.py
+"""블로그 백그라운드 작업 (jobs 앱의 run_jobs 워커가 실행)"""
+from django.conf import settings
+
+from jobs.queue import task
+
+from .counters import view_counter
+from .models import Post
+
+
+@task("blog.render_post", priority=10)
+def render_post(post_id):
+    """본문 마크다운 렌더링 결과와 요약/단어 수/읽는 시간 저장"""
+    post = Post.objects.filter(pk=post_id).first()
+    if post is None:
+        return
+    post.render_content()
+    post.save(update_fields=post.rendered_fields)
+
+
+def flush_view_counts():
+    view_counter.flush()
+
+
+# 카운터 캐시를 여러 프로세스가 공유(Redis 등)할 때만 워커에서도 반영
+# (프로세스별 버퍼면 워커에서는 반영할 것이 없고 Job 행 쓰기만 늘어남)
+if view_counter.is_shared:
+    task(
+        "blog.flush_view_counts",
+        every=getattr(settings, "BLOG_VIEW_COUNT_FLUSH_INTERVAL", 10) or 10,
+    )(flush_view_counts)
@@ -0,0 +1,38 @@
+# blog/management/commands/backfill_like_counts.py
+import time
+
+from django.core.management.base import BaseCommand
+from django.db.models import Max
+
+from blog.counters import recount_likes
+from blog.models import Post
+
+
+class Command(BaseCommand):
+    help = "좋아요 테이블을 기준으로 게시글의 like_count를 id 구간별로 나누어 채웁니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="한 번의 UPDATE로 처리할 게시글 id 범위",
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=0,
+            help="구간 사이에 쉴 시간(초), 운영 중 DB 부하를 줄일 때 사용",
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options["chunk_size"]
+        last_pk = Post.objects.aggregate(last=Max("pk"))["last"] or 0
+        total = 0
+        for start in range(0, last_pk + 1, chunk_size):
+            total += recount_likes(
+                Post.objects.filter(pk__gte=start, pk__lt=start + chunk_size)
+            )
+            if options["sleep"]:
+                time.sleep(options["sleep"])
+        self.stdout.write(self.style.SUCCESS(f"게시글 {total}개의 like_count 갱신"))
@@ -0,0 +1,68 @@
+# blog/management/commands/check_query_plans.py
+from types import SimpleNamespace
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test import RequestFactory
+from django.utils import timezone
+
+from blog.models import Post, Tag
+from blog.pagination import KeysetPaginator, encode_cursor
+from blog.views import (
+    CommentListView,
+    PostByTagListView,
+    PostListView,
+)
+
+
+class Command(BaseCommand):
+    help = "블로그 뷰가 실행하는 주요 쿼리의 실행 계획이 전용 인덱스를 쓰는지 확인합니다."
+
+    def handle(self, *args, **options):
+        verbose = options["verbosity"] >= 2
+        failures = []
+        for label, queryset, index_name in self.cases():
+            plan = queryset.explain()
+            if verbose:
+                self.stdout.write(f"[{label}]\n{plan}\n")
+            if index_name not in plan:
+                failures.append(f"{label}: {index_name} 미사용\n{plan}")
+            else:
+                self.stdout.write(f"{label}: {index_name} 사용")
+
+        if failures:
+            raise CommandError("\n\n".join(failures))
+        self.stdout.write(self.style.SUCCESS("모든 쿼리가 인덱스를 사용합니다."))
+
+    def cases(self):
+        """(설명, 뷰와 같은 쿼리셋, 사용해야 하는 인덱스 이름)"""
+        factory = RequestFactory()
+        # 데이터가 없어도 쿼리 모양은 같으므로 현재 시각을 커서로 사용
+        cursor = encode_cursor(SimpleNamespace(created_at=timezone.now(), pk=0))
+
+        view = PostListView()
+        view.setup(factory.get("/"))
+        paginator = KeysetPaginator(view.get_queryset(), view.paginate_by)
+        yield "게시글 목록", paginator.page_queryset(), "blog_post_published_idx"
+        yield (
+            "게시글 목록 (다음 페이지)",
+            paginator.page_queryset(after=cursor),
+            "blog_post_published_idx",
+        )
+
+        tag = Tag.objects.order_by("pk").first()
+        if tag is None:
+            self.stdout.write(self.style.WARNING("태그가 없어 태그별 목록은 건너뜁니다."))
+        else:
+            view = PostByTagListView()
+            view.setup(factory.get("/"), slug=tag.slug)
+            paginator = KeysetPaginator(view.get_queryset(), view.paginate_by)
+            yield "태그별 목록", paginator.page_queryset(), "blog_post_tags_tag_post_idx"
+
+        comments = Post(pk=0).comments.select_related("author")
+        paginator = KeysetPaginator(comments, CommentListView.paginate_by, ascending=True)
+        yield "댓글 목록", paginator.page_queryset(), "blog_comment_post_created_idx"
+        yield (
+            "댓글 목록 (더 보기)",
+            paginator.page_queryset(after=cursor),
+            "blog_comment_post_created_idx",
+        )
@@ -0,0 +1,38 @@
+# blog/management/commands/flush_view_counts.py
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from blog.counters import view_counter
+
+
+class Command(BaseCommand):
+    help = "버퍼에 쌓인 게시글 조회수를 DB에 일괄 반영합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="종료하지 않고 --interval 초마다 반복 실행",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=10,
+            help="--loop 실행 시 플러시 간격(초)",
+        )
+
+    def handle(self, *args, **options):
+        if not view_counter.is_shared:
+            # 버퍼가 웹 프로세스 메모리에 있어 이 프로세스에서는 비어 있음
+            raise CommandError(
+                "BLOG_VIEW_COUNT_CACHE가 프로세스 간 공유되지 않는 캐시입니다. "
+                "조회수는 웹 프로세스가 직접 반영하며, 이 명령을 쓰려면 "
+                "Redis/Memcached 같은 공유 캐시로 바꾸세요."
+            )
+        while True:
+            flushed = view_counter.flush()
+            self.stdout.write(f"조회수 {flushed}회 반영")
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
@@ -0,0 +1,22 @@
+# blog/management/commands/rebuild_search_index.py
+from django.core.management.base import BaseCommand, CommandError
+
+from blog import search
+
+
+class Command(BaseCommand):
+    help = "게시글 전문 검색(FTS5) 색인을 처음부터 다시 만듭니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="한 번에 읽어 색인할 게시글 수",
+        )
+
+    def handle(self, *args, **options):
+        if not search.is_available():
+            raise CommandError("FTS 색인 테이블이 없습니다. migrate를 먼저 실행하세요.")
+        total = search.rebuild_index(chunk_size=options["chunk_size"])
+        self.stdout.write(self.style.SUCCESS(f"게시글 {total}개 색인 완료"))
@@ -0,0 +1,50 @@
+# blog/management/commands/rerender_posts.py
+from django.core.management.base import BaseCommand
+
+from blog import dependencies as deps
+from blog.models import Post
+from blog.rendering import renderer_version
+from main.cache_deps import bump
+
+
+class Command(BaseCommand):
+    help = "마크다운 확장 설정이나 렌더러 버전이 바뀐 게시글의 HTML을 일괄 재생성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="버전과 관계없이 모든 게시글을 다시 렌더링",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=200,
+            help="한 번에 저장할 게시글 수",
+        )
+
+    def handle(self, *args, **options):
+        version = renderer_version()
+        queryset = Post.objects.only("pk", "content").order_by("pk")
+        if not options["all"]:
+            queryset = queryset.exclude(content_html_version=version)
+
+        batch_size = options["batch_size"]
+        batch = []
+        total = 0
+        for post in queryset.iterator(chunk_size=batch_size):
+            post.render_content()
+            batch.append(post)
+            if len(batch) >= batch_size:
+                total += self._save(batch)
+                batch = []
+        if batch:
+            total += self._save(batch)
+
+        self.stdout.write(self.style.SUCCESS(f"게시글 {total}개 다시 렌더링 (버전 {version})"))
+
+    def _save(self, batch):
+        Post.objects.bulk_update(batch, Post.rendered_fields)
+        # bulk_update는 시그널을 보내지 않으므로 캐시된 상세/목록을 직접 무효화
+        bump(*(deps.post(post.pk) for post in batch), deps.POSTS)
+        return len(batch)
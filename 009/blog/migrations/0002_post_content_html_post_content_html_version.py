@@ -0,0 +1,23 @@
+# Generated by Django 5.2.8 on 2026-10-18 16:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='content_html',
+            field=models.TextField(blank=True, editable=False, verbose_name='렌더링된 내용'),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='content_html_version',
+            field=models.CharField(blank=True, editable=False, max_length=32, verbose_name='렌더러 버전'),
+        ),
+    ]
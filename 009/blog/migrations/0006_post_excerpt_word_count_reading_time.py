@@ -0,0 +1,54 @@
+# Generated by Django 5.2.8 on 2026-10-18 16:16
+
+from django.db import migrations, models
+
+
+def fill_rendered_fields(apps, schema_editor):
+    from blog.rendering import render_markdown_uncached, renderer_version, summarize
+
+    Post = apps.get_model("blog", "Post")
+    version = renderer_version()
+    fields = [
+        "content_html",
+        "content_html_version",
+        "excerpt",
+        "word_count",
+        "reading_time",
+    ]
+    batch = []
+    for post in Post.objects.only("pk", "content").iterator(chunk_size=200):
+        post.content_html = render_markdown_uncached(post.content)
+        post.content_html_version = version
+        post.excerpt, post.word_count, post.reading_time = summarize(post.content_html)
+        batch.append(post)
+        if len(batch) >= 200:
+            Post.objects.bulk_update(batch, fields)
+            batch = []
+    if batch:
+        Post.objects.bulk_update(batch, fields)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0005_post_comment_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='excerpt',
+            field=models.CharField(blank=True, editable=False, max_length=300, verbose_name='요약'),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='reading_time',
+            field=models.PositiveSmallIntegerField(default=0, editable=False, verbose_name='읽는 시간(분)'),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='word_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='단어 수'),
+        ),
+        migrations.RunPython(fill_rendered_fields, migrations.RunPython.noop),
+    ]
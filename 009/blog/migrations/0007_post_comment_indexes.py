@@ -0,0 +1,30 @@
+# Generated by Django 5.2.8 on 2026-10-18 16:24
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0006_post_excerpt_word_count_reading_time'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # 자동 생성된 태그 연결 테이블에는 (post_id, tag_id) 유니크 인덱스만 있으므로
+        # 태그별 목록용 (tag_id, post_id) 인덱스를 직접 추가
+        migrations.RunSQL(
+            'CREATE INDEX "blog_post_tags_tag_post_idx" '
+            'ON "blog_post_tags" ("tag_id", "post_id")',
+            reverse_sql='DROP INDEX "blog_post_tags_tag_post_idx"',
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['post', 'created_at', 'id'], name='blog_comment_post_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['-created_at', '-id'], name='blog_post_published_idx'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.8 on 2026-10-18 16:33
+
+import main.imaging
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0007_post_comment_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='thumbnail_height',
+            field=models.PositiveIntegerField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='thumbnail_placeholder',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='thumbnail_width',
+            field=models.PositiveIntegerField(editable=False, null=True),
+        ),
+        migrations.AlterField(
+            model_name='post',
+            name='thumbnail',
+            field=main.imaging.ResponsiveImageField(blank=True, height_field='thumbnail_height', null=True, placeholder_field='thumbnail_placeholder', preset='thumbnail', upload_to='post_images/', verbose_name='썸네일 이미지', width_field='thumbnail_width'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.8 on 2026-10-18 16:36
+
+import main.imaging
+import main.storage
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0008_post_thumbnail_variants'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='post',
+            name='thumbnail',
+            field=main.imaging.ResponsiveImageField(blank=True, height_field='thumbnail_height', null=True, placeholder_field='thumbnail_placeholder', preset='thumbnail', storage=main.storage.upload_storage, upload_to='post_images/', verbose_name='썸네일 이미지', width_field='thumbnail_width'),
+        ),
+    ]
@@ -1,8 +1,13 @@
 # blog/models.py
-from django.db import models
+from django.db import IntegrityError, models, transaction
+from django.db.models import F
 from django.conf import settings
 from django.utils.text import slugify
 
+from main.imaging import ResponsiveImageField
+from main.storage import upload_storage
+from main.url_builder import build_url
+
 
 class Tag(models.Model):
     name = models.CharField(max_length=50, unique=True, verbose_name="태그명")
@@ -23,14 +28,27 @@ class Tag(models.Model):
         super().save(*args, **kwargs)
 
     def get_absolute_url(self):
-        from django.urls import reverse
-
-        return reverse("blog:post_by_tag", kwargs={"slug": self.slug})
+        return build_url("blog:post_by_tag", self.slug)
 
 
 class Post(models.Model):
     title = models.CharField(max_length=200, verbose_name="제목")
     content = models.TextField(verbose_name="내용")
+    content_html = models.TextField(
+        blank=True, editable=False, verbose_name="렌더링된 내용"
+    )
+    content_html_version = models.CharField(
+        max_length=32, blank=True, editable=False, verbose_name="렌더러 버전"
+    )
+    excerpt = models.CharField(
+        max_length=300, blank=True, editable=False, verbose_name="요약"
+    )
+    word_count = models.PositiveIntegerField(
+        default=0, editable=False, verbose_name="단어 수"
+    )
+    reading_time = models.PositiveSmallIntegerField(
+        default=0, editable=False, verbose_name="읽는 시간(분)"
+    )
     author = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
@@ -47,34 +65,157 @@ class Post(models.Model):
         blank=True,
         verbose_name="좋아요",
     )
-    thumbnail = models.ImageField(
-        upload_to="post_images/", blank=True, null=True, verbose_name="썸네일 이미지"
+    like_count = models.PositiveIntegerField(
+        default=0, editable=False, verbose_name="좋아요 수"
+    )
+    comment_count = models.PositiveIntegerField(
+        default=0, editable=False, verbose_name="댓글 수"
     )
+    thumbnail = ResponsiveImageField(
+        upload_to="post_images/",
+        storage=upload_storage,
+        blank=True,
+        null=True,
+        verbose_name="썸네일 이미지",
+        preset="thumbnail",
+        width_field="thumbnail_width",
+        height_field="thumbnail_height",
+        placeholder_field="thumbnail_placeholder",
+    )
+    thumbnail_width = models.PositiveIntegerField(null=True, editable=False)
+    thumbnail_height = models.PositiveIntegerField(null=True, editable=False)
+    thumbnail_placeholder = models.TextField(blank=True, editable=False)
     tags = models.ManyToManyField(
         Tag, related_name="posts", blank=True, verbose_name="태그"
     )
 
+    # F() 업데이트로만 바뀌는 카운터 컬럼 (전체 저장 시 덮어쓰지 않음)
+    counter_fields = ["view_count", "like_count", "comment_count"]
+    # 본문에서 계산해 저장하는 컬럼 (render_content가 채움)
+    rendered_fields = [
+        "content_html",
+        "content_html_version",
+        "excerpt",
+        "word_count",
+        "reading_time",
+    ]
+
     class Meta:
         ordering = ["-created_at"]
         verbose_name = "게시글"
         verbose_name_plural = "게시글 목록"
+        indexes = [
+            # 공개 글 목록의 최신순 (커서) 페이지네이션
+            models.Index(
+                fields=["-created_at", "-id"],
+                condition=models.Q(is_published=True),
+                name="blog_post_published_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.title
 
-    def get_absolute_url(self):
-        from django.urls import reverse
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        render_later = False
+        if update_fields is None or "content" in update_fields:
+            if getattr(settings, "BLOG_RENDER_IN_BACKGROUND", False):
+                # 렌더링은 작업 큐에서. 그동안 rendered_content는 바로 렌더링해 보여줌
+                self.content_html_version = ""
+                render_later = True
+            else:
+                self.render_content()
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, *self.rendered_fields}
+        if (
+            update_fields is None
+            and not self._state.adding
+            and not kwargs.get("force_insert")
+            and kwargs.get("using") in (None, self._state.db)
+        ):
+            # Django가 갱신할 컬럼(지연 로딩되어 읽지 않은 필드 제외)에서 카운터만 뺌
+            deferred = self.get_deferred_fields()
+            kwargs["update_fields"] = [
+                field.attname
+                for field in self._meta.concrete_fields
+                if not field.primary_key
+                and not field.generated
+                and field.attname not in deferred
+                and field.name not in self.counter_fields
+            ]
+        super().save(*args, **kwargs)
+        if render_later:
+            from jobs.queue import enqueue
+
+            enqueue(
+                "blog.render_post",
+                post_id=self.pk,
+                unique_key=f"blog.render_post:{self.pk}",
+            )
+
+    def render_content(self):
+        """본문 마크다운을 HTML로 렌더링하고 요약/단어 수/읽는 시간을 계산"""
+        from .rendering import render_markdown, renderer_version, summarize
+
+        self.content_html = render_markdown(self.content)
+        self.content_html_version = renderer_version()
+        self.excerpt, self.word_count, self.reading_time = summarize(
+            self.content_html
+        )
+
+    @property
+    def rendered_content(self):
+        """저장된 HTML (렌더러가 바뀌었으면 캐시를 거쳐 다시 렌더링)"""
+        from .rendering import render_markdown, renderer_version
+
+        if self.content_html_version == renderer_version():
+            return self.content_html
+        return render_markdown(self.content)
 
-        return reverse("blog:post_detail", kwargs={"pk": self.pk})
+    def get_absolute_url(self):
+        return build_url("blog:post_detail", self.pk)
 
     def increment_view_count(self):
-        """조회수 1 증가"""
-        self.view_count += 1
-        self.save(update_fields=["view_count"])
+        """조회수 1 증가 (버퍼에 기록한 뒤 주기적으로 DB에 일괄 반영)"""
+        from .counters import view_counter
+
+        view_counter.record(self.pk)
+        self.view_count += view_counter.pending(self.pk)
 
     def total_likes(self):
-        """총 좋아요 수 반환"""
-        return self.likes.count()
+        """총 좋아요 수 반환 (like_count 컬럼 사용, 추가 쿼리 없음)"""
+        return self.like_count
+
+    def is_liked_by(self, user):
+        """user가 좋아요를 눌렀는지 여부"""
+        if not user.is_authenticated:
+            return False
+        return Post.likes.through.objects.filter(
+            post_id=self.pk, user_id=user.pk
+        ).exists()
+
+    def add_like(self, user):
+        """좋아요 추가 (이미 눌렀으면 무시), 새로 추가되었으면 True 반환"""
+        try:
+            with transaction.atomic():
+                Post.likes.through.objects.create(post_id=self.pk, user_id=user.pk)
+                Post.objects.filter(pk=self.pk).update(like_count=F("like_count") + 1)
+        except IntegrityError:
+            return False
+        return True
+
+    def remove_like(self, user):
+        """좋아요 취소 (누르지 않았으면 무시), 실제로 취소되었으면 True 반환"""
+        with transaction.atomic():
+            deleted, _ = Post.likes.through.objects.filter(
+                post_id=self.pk, user_id=user.pk
+            ).delete()
+            if deleted:
+                Post.objects.filter(pk=self.pk).update(
+                    like_count=F("like_count") - deleted
+                )
+        return bool(deleted)
 
 
 class Comment(models.Model):
@@ -95,9 +236,16 @@ class Comment(models.Model):
         ordering = ["created_at"]
         verbose_name = "댓글"
         verbose_name_plural = "댓글 목록"
+        indexes = [
+            # 게시글별 댓글을 작성 순으로 (커서) 페이지네이션
+            models.Index(
+                fields=["post", "created_at", "id"], name="blog_comment_post_created_idx"
+            ),
+        ]
 
     def __str__(self):
         return f"{self.author.get_display_name()}: {self.content[:20]}"
 
     def get_absolute_url(self):
-        return self.post.get_absolute_url()
+        # 게시글 상세의 해당 댓글 위치 (post를 불러오지 않도록 post_id 사용)
+        return f"{build_url('blog:post_detail', self.post_id)}#comment-{self.pk}"
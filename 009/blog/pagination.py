@@ -0,0 +1,133 @@
+# blog/pagination.py
+"""(created_at, id) 기준 커서(keyset) 페이지네이션
+
+OFFSET 없이 "마지막으로 본 글보다 오래된 글"을 조건으로 다음 페이지를 읽으므로
+페이지가 깊어져도 비용이 같고, COUNT(*)도 실행하지 않습니다.
+커서는 "<작성 시각 마이크로초>-<id>" 형태의 문자열입니다.
+"""
+from datetime import datetime, timedelta, timezone
+
+from django.conf import settings
+from django.db.models import Q
+from django.http import Http404
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+MICROSECOND = timedelta(microseconds=1)
+
+
+def encode_cursor(obj):
+    return f"{(obj.created_at - EPOCH) // MICROSECOND}-{obj.pk}"
+
+
+def decode_cursor(cursor):
+    try:
+        micros, pk = cursor.split("-")
+        return EPOCH + int(micros) * MICROSECOND, int(pk)
+    except (ValueError, OverflowError, OSError):
+        raise Http404("잘못된 페이지 커서입니다.")
+
+
+class KeysetPage:
+    is_keyset = True
+
+    def __init__(self, object_list, has_next, has_previous):
+        self.object_list = object_list
+        self.has_next_page = has_next
+        self.has_previous_page = has_previous
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self.has_next_page
+
+    def has_previous(self):
+        return self.has_previous_page
+
+    def has_other_pages(self):
+        return self.has_next_page or self.has_previous_page
+
+    @property
+    def next_cursor(self):
+        return encode_cursor(self.object_list[-1]) if self.has_next_page else None
+
+    @property
+    def previous_cursor(self):
+        return encode_cursor(self.object_list[0]) if self.has_previous_page else None
+
+
+class KeysetPaginator:
+    """(created_at, id) 순으로 페이지를 나눕니다.
+
+    기본은 최신 글부터(내림차순), ascending=True면 오래된 것부터(댓글 등)입니다.
+    """
+
+    def __init__(self, queryset, per_page, ascending=False):
+        self.queryset = queryset
+        self.per_page = per_page
+        self.ascending = ascending
+
+    def _following(self, cursor, forward=True):
+        """커서 다음(forward) 또는 이전 항목을 고르는 조건"""
+        created_at, pk = decode_cursor(cursor)
+        op = "gt" if self.ascending == forward else "lt"
+        return Q(**{f"created_at__{op}": created_at}) | Q(
+            created_at=created_at, **{f"pk__{op}": pk}
+        )
+
+    def _ordering(self, forward=True):
+        if self.ascending == forward:
+            return ("created_at", "pk")
+        return ("-created_at", "-pk")
+
+    def page_queryset(self, after=None, before=None):
+        """page()가 실행하는 쿼리 (한 건을 더 읽어 다음 페이지 여부를 판단)"""
+        if before:
+            queryset = self.queryset.filter(self._following(before, forward=False))
+            ordering = self._ordering(forward=False)
+        else:
+            queryset = self.queryset
+            if after:
+                queryset = queryset.filter(self._following(after))
+            ordering = self._ordering()
+        return queryset.order_by(*ordering)[: self.per_page + 1]
+
+    def page(self, after=None, before=None):
+        rows = list(self.page_queryset(after, before))
+        if before:
+            has_previous = len(rows) > self.per_page
+            rows = rows[: self.per_page]
+            rows.reverse()
+            return KeysetPage(rows, has_next=True, has_previous=has_previous)
+
+        has_next = len(rows) > self.per_page
+        return KeysetPage(rows[: self.per_page], has_next, has_previous=bool(after))
+
+
+class KeysetPaginationMixin:
+    """ListView용 믹스인: ?after=/?before= 커서 페이지네이션과 기존 번호 페이지네이션 전환
+
+    pagination_mode가 "keyset"이면 커서 방식, "page"면 Django 기본 Paginator를 씁니다.
+    ?page= 파라미터가 오면 기존 링크 호환을 위해 번호 방식으로 처리합니다.
+    """
+
+    pagination_mode = None
+
+    def get_pagination_mode(self):
+        if "page" in self.request.GET:
+            return "page"
+        return self.pagination_mode or getattr(
+            settings, "BLOG_PAGINATION_MODE", "keyset"
+        )
+
+    def paginate_queryset(self, queryset, page_size):
+        if self.get_pagination_mode() != "keyset":
+            return super().paginate_queryset(queryset, page_size)
+        page = KeysetPaginator(queryset, page_size).page(
+            after=self.request.GET.get("after"),
+            before=self.request.GET.get("before"),
+        )
+        return None, page, page.object_list, page.has_other_pages()
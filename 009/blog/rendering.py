@@ -0,0 +1,134 @@
+# blog/rendering.py
+"""마크다운 렌더링과 렌더 결과 캐시
+
+같은 본문과 같은 확장 설정이면 결과 HTML도 같으므로,
+(본문 + 확장 설정)의 해시를 키로 렌더 결과를 재사용합니다.
+1차는 프로세스 내 LRU, 2차(선택)는 Django 캐시(파일/Redis 등)입니다.
+"""
+import functools
+import hashlib
+import html
+import json
+import math
+import threading
+from collections import OrderedDict
+
+import markdown as md
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.html import strip_tags
+from django.utils.text import Truncator
+
+MARKDOWN_EXTENSIONS = [
+    "fenced_code",
+    "codehilite",
+    "tables",
+    "nl2br",
+]
+MARKDOWN_EXTENSION_CONFIGS = {}
+
+# 렌더링 방식(후처리 등)을 바꾸면 올려 주세요. 저장된 HTML을 다시 렌더링합니다.
+# 2: 요약(excerpt), 단어 수, 읽는 시간 추가
+RENDERER_VERSION = 2
+
+EXCERPT_WORDS = 20
+EXCERPT_MAX_CHARS = 300  # Post.excerpt max_length
+WORDS_PER_MINUTE = 200
+
+
+@functools.lru_cache(maxsize=None)
+def config_fingerprint():
+    """렌더 결과에 영향을 주는 설정을 문자열로 직렬화"""
+    return json.dumps(
+        {
+            "markdown": md.__version__,
+            "extensions": MARKDOWN_EXTENSIONS,
+            "configs": MARKDOWN_EXTENSION_CONFIGS,
+        },
+        sort_keys=True,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def renderer_version():
+    """Post.content_html_version에 저장하는 값 (버전 + 확장 설정 해시)"""
+    digest = hashlib.sha1(config_fingerprint().encode()).hexdigest()[:8]
+    return f"{RENDERER_VERSION}:{digest}"
+
+
+def render_markdown_uncached(text):
+    """마크다운 텍스트를 HTML로 변환 (캐시 없이)"""
+    return md.markdown(
+        text,
+        extensions=MARKDOWN_EXTENSIONS,
+        extension_configs=MARKDOWN_EXTENSION_CONFIGS,
+    )
+
+
+class RenderCache:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+    @property
+    def maxsize(self):
+        return getattr(settings, "BLOG_MARKDOWN_CACHE_SIZE", 256)
+
+    @property
+    def persistent(self):
+        alias = getattr(settings, "BLOG_MARKDOWN_CACHE", None)
+        return caches[alias] if alias else None
+
+    def key(self, text):
+        digest = hashlib.sha256()
+        digest.update(config_fingerprint().encode())
+        digest.update(b"\0")
+        digest.update(text.encode())
+        return f"blog:markdown:{digest.hexdigest()}"
+
+    def render(self, text):
+        key = self.key(text)
+        with self._lock:
+            html = self._entries.get(key)
+            if html is not None:
+                self._entries.move_to_end(key)
+                return html
+
+        persistent = self.persistent
+        html = persistent.get(key) if persistent is not None else None
+        if html is None:
+            html = render_markdown_uncached(text)
+            if persistent is not None:
+                persistent.set(key, html)
+
+        with self._lock:
+            self._entries[key] = html
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return html
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+        config_fingerprint.cache_clear()
+        renderer_version.cache_clear()
+
+
+render_cache = RenderCache()
+
+
+def render_markdown(text):
+    """마크다운 텍스트를 HTML로 변환 (렌더 캐시 사용)"""
+    if not text:
+        return ""
+    return render_cache.render(text)
+
+
+def summarize(content_html):
+    """렌더링된 HTML에서 (요약, 단어 수, 읽는 시간(분))을 계산"""
+    text = " ".join(html.unescape(strip_tags(content_html)).split())
+    word_count = len(text.split())
+    excerpt = Truncator(Truncator(text).words(EXCERPT_WORDS)).chars(EXCERPT_MAX_CHARS)
+    reading_time = max(1, math.ceil(word_count / WORDS_PER_MINUTE)) if word_count else 0
+    return excerpt, word_count, reading_time
@@ -0,0 +1,231 @@
+# blog/search.py
+"""SQLite FTS5 기반 게시글 전문 검색
+
+한국어는 띄어쓰기 단위로 조사가 붙어 단어 단위 색인이 잘 맞지 않으므로,
+한글/한자/가나 구간은 2글자씩 겹쳐 자른 바이그램으로 색인합니다.
+("장고블로그" → "장고 고블 블로 로그")
+검색어도 같은 방식으로 잘라 구문(phrase) 검색을 하면 부분 문자열 검색과
+거의 같은 결과를 색인만으로 얻을 수 있습니다.
+"""
+import re
+
+from django.db import connection
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+from django.utils.html import escape, strip_tags
+from django.utils.safestring import mark_safe
+
+FTS_TABLE = "blog_post_fts"
+
+# bm25 가중치: 제목, 본문, 태그 순
+BM25_WEIGHTS = (10.0, 1.0, 5.0)
+
+_WORD_RE = re.compile(r"\w+")
+# 한글 자모/음절, 한글 호환 자모, 히라가나/가타카나, CJK 한자
+_CJK_RE = re.compile(
+    r"([\u1100-\u11ff\uac00-\ud7a3\u3130-\u318f\u3040-\u30ff\u4e00-\u9fff]+)"
+)
+
+
+def _runs(word):
+    """단어를 (구간, CJK 여부) 목록으로 분리 ("django로" → [("django", False), ("로", True)])"""
+    for index, run in enumerate(_CJK_RE.split(word)):
+        if run:
+            yield run, index % 2 == 1
+
+
+def _bigrams(run):
+    if len(run) == 1:
+        return [run]
+    return [run[i : i + 2] for i in range(len(run) - 1)]
+
+
+def tokenize(text):
+    """색인용 토큰 목록"""
+    tokens = []
+    for word in _WORD_RE.findall(text.lower()):
+        for run, is_cjk in _runs(word):
+            tokens.extend(_bigrams(run) if is_cjk else [run])
+    return tokens
+
+
+def index_text(text):
+    return " ".join(tokenize(text or ""))
+
+
+def _search_runs(search):
+    for word in _WORD_RE.findall(search.lower()):
+        yield from _runs(word)
+
+
+def build_match_query(search):
+    """검색어를 FTS5 MATCH 구문으로 변환 (모든 단어를 AND로 연결)
+
+    한 글자 CJK 구간은 색인의 바이그램 앞부분으로만 찾을 수 있어 단어 끝 글자를
+    놓치므로 빼고, search_posts가 icontains로 따로 거릅니다. (short_cjk_terms)
+    """
+    clauses = []
+    for run, is_cjk in _search_runs(search):
+        if not is_cjk:
+            clauses.append('"%s"*' % run)
+        elif len(run) > 1:
+            clauses.append('"%s"' % " ".join(_bigrams(run)))
+    return " AND ".join(clauses)
+
+
+def short_cjk_terms(search):
+    """색인으로 찾을 수 없는 한 글자 CJK 구간 ("요 장고" → ["요"])"""
+    return [run for run, is_cjk in _search_runs(search) if is_cjk and len(run) == 1]
+
+
+# 색인 테이블이 확인된 DB 별칭 (마이그레이션 전에는 없을 수 있으므로 있을 때만 기억)
+_available_aliases = set()
+
+
+def is_available():
+    """현재 DB에서 FTS 검색을 사용할 수 있는지 여부"""
+    if connection.vendor != "sqlite":
+        return False
+    if connection.alias not in _available_aliases:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s",
+                [FTS_TABLE],
+            )
+            if cursor.fetchone() is None:
+                return False
+        _available_aliases.add(connection.alias)
+    return True
+
+
+def search_posts(queryset, search):
+    """queryset을 검색어로 거르고 bm25 점수 순으로 정렬
+
+    FTS를 쓸 수 없는 환경(다른 DB, 색인 없음)에서는 기존 icontains 검색을 사용합니다.
+    한 글자 CJK 검색어는 icontains로 거르고, 나머지 단어가 없으면 점수 없이 반환합니다.
+    """
+    if not is_available():
+        return queryset.filter(
+            Q(title__icontains=search) | Q(content__icontains=search)
+        )
+
+    match = build_match_query(search)
+    terms = short_cjk_terms(search)
+    if not match and not terms:
+        # 단어가 없는 검색어 (기호만 입력 등)
+        return queryset.filter(
+            Q(title__icontains=search) | Q(content__icontains=search)
+        )
+    for term in terms:
+        queryset = queryset.filter(
+            Q(title__icontains=term) | Q(content__icontains=term)
+        )
+    if not match:
+        return queryset
+
+    weights = ", ".join(str(weight) for weight in BM25_WEIGHTS)
+    table = queryset.model._meta.db_table
+    return (
+        queryset.filter(
+            pk__in=RawSQL(
+                f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s", [match]
+            )
+        )
+        # 걸러진 행마다 rowid로 색인 행 하나를 찾아 점수 계산
+        .annotate(
+            search_rank=RawSQL(
+                f"SELECT bm25({FTS_TABLE}, {weights}) FROM {FTS_TABLE}"
+                f" WHERE {FTS_TABLE} MATCH %s AND rowid = {table}.id",
+                [match],
+            )
+        )
+        .order_by("search_rank")
+    )
+
+
+def make_snippet(post, search, length=120):
+    """본문에서 검색어 주변을 잘라 <mark>로 강조한 HTML 조각"""
+    text = " ".join(strip_tags(post.content_html or post.content).split())
+    terms = [term for term in _WORD_RE.findall(search) if term]
+    if not terms:
+        return escape(text[:length])
+
+    pattern = re.compile("|".join(re.escape(term) for term in terms), re.IGNORECASE)
+    match = pattern.search(text)
+    start = max(0, match.start() - length // 3) if match else 0
+    window = text[start : start + length]
+
+    parts = []
+    position = 0
+    for found in pattern.finditer(window):
+        parts.append(escape(window[position : found.start()]))
+        parts.append(f"<mark>{escape(found.group())}</mark>")
+        position = found.end()
+    parts.append(escape(window[position:]))
+
+    prefix = "…" if start > 0 else ""
+    suffix = "…" if start + length < len(text) else ""
+    return mark_safe(prefix + "".join(parts) + suffix)
+
+
+def _index_row(post):
+    return [
+        post.pk,
+        index_text(post.title),
+        index_text(post.content),
+        index_text(" ".join(tag.name for tag in post.tags.all())),
+    ]
+
+
+def index_posts(posts):
+    """게시글들의 색인을 새로 기록"""
+    if not is_available():
+        return
+    rows = [_index_row(post) for post in posts]
+    if not rows:
+        return
+    with connection.cursor() as cursor:
+        _delete_rows(cursor, [row[0] for row in rows])
+        _insert_rows(cursor, rows)
+
+
+def unindex_posts(pks):
+    if not is_available() or not pks:
+        return
+    with connection.cursor() as cursor:
+        _delete_rows(cursor, pks)
+
+
+def rebuild_index(post_model=None, chunk_size=500):
+    """전체 색인을 다시 만들고 색인한 게시글 수를 반환"""
+    if post_model is None:
+        from .models import Post as post_model
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE}")
+        queryset = post_model.objects.only("pk", "title", "content").prefetch_related(
+            "tags"
+        )
+        total = 0
+        batch = []
+        for post in queryset.order_by("pk").iterator(chunk_size=chunk_size):
+            batch.append(_index_row(post))
+            if len(batch) >= chunk_size:
+                total += _insert_rows(cursor, batch)
+                batch = []
+        if batch:
+            total += _insert_rows(cursor, batch)
+        cursor.execute(f"INSERT INTO {FTS_TABLE} ({FTS_TABLE}) VALUES ('optimize')")
+    return total
+
+
+def _insert_rows(cursor, rows):
+    cursor.executemany(
+        f"INSERT INTO {FTS_TABLE} (rowid, title, content, tags) VALUES (%s, %s, %s, %s)",
+        rows,
+    )
+    return len(rows)
+
+
+def _delete_rows(cursor, pks):
+    cursor.executemany(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [[pk] for pk in pks])
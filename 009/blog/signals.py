@@ -0,0 +1,234 @@
+# blog/signals.py
+from django.db.models import F
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_init,
+    post_save,
+    pre_delete,
+)
+from django.dispatch import receiver
+
+from main.cache_deps import bump_on_commit
+
+from . import dependencies as deps
+from . import search
+from .counters import recount_likes
+from .models import Comment, Post, Tag
+
+
+# clear()는 pk_set을 주지 않으므로 지우기 전에 대상을 기억
+@receiver(m2m_changed, sender=Post.tags.through)
+@receiver(m2m_changed, sender=Post.likes.through)
+def remember_cleared(sender, instance, action, reverse, **kwargs):
+    if action != "pre_clear":
+        return
+    if not reverse:
+        instance._cleared_tag_slugs = list(instance.tags.values_list("slug", flat=True))
+    elif sender is Post.tags.through:
+        instance._cleared_post_pks = list(instance.posts.values_list("pk", flat=True))
+    else:
+        instance._cleared_post_pks = list(
+            instance.liked_posts.values_list("pk", flat=True)
+        )
+
+
+# 검색 색인 동기화
+@receiver(post_save, sender=Post)
+def index_post(sender, instance, **kwargs):
+    search.index_posts([instance])
+
+
+@receiver(post_delete, sender=Post)
+def unindex_post(sender, instance, **kwargs):
+    search.unindex_posts([instance.pk])
+
+
+@receiver(m2m_changed, sender=Post.tags.through)
+def reindex_post_tags(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse:
+        search.index_posts([instance])
+    else:
+        pks = instance._cleared_post_pks if action == "post_clear" else pk_set
+        search.index_posts(Post.objects.filter(pk__in=pks))
+
+
+@receiver(post_save, sender=Tag)
+def reindex_tag_posts(sender, instance, created, **kwargs):
+    if not created:
+        search.index_posts(instance.posts.all())
+
+
+@receiver(pre_delete, sender=Tag)
+def remember_tag_posts(sender, instance, **kwargs):
+    instance._deleted_post_pks = list(instance.posts.values_list("pk", flat=True))
+
+
+@receiver(post_delete, sender=Tag)
+def reindex_deleted_tag_posts(sender, instance, **kwargs):
+    search.index_posts(Post.objects.filter(pk__in=instance._deleted_post_pks))
+
+
+# 관리자 화면 등에서 likes를 직접 바꾼 경우 like_count 재계산
+# (Post.add_like/remove_like는 좋아요 테이블을 직접 다루므로 이 시그널을 거치지 않음)
+@receiver(m2m_changed, sender=Post.likes.through)
+def recount_post_likes(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse:
+        recount_likes(Post.objects.filter(pk=instance.pk))
+    elif pk_set:
+        recount_likes(Post.objects.filter(pk__in=pk_set))
+    else:
+        # user.liked_posts.clear(): 대상 게시글을 알 수 없으므로 불일치만 골라 재계산
+        recount_likes(Post.objects.filter(like_count__gt=0))
+
+
+# 삭제 중인 게시글 pk: 함께 지워지는 댓글마다 게시글을 갱신/무효화하지 않도록
+# (Collector는 댓글을 먼저 지우고 게시글의 post_delete를 마지막에 보냄)
+_deleting_post_pks = set()
+
+
+@receiver(pre_delete, sender=Post)
+def mark_post_deleting(sender, instance, **kwargs):
+    _deleting_post_pks.add(instance.pk)
+
+
+@receiver(post_delete, sender=Post)
+def unmark_post_deleting(sender, instance, **kwargs):
+    _deleting_post_pks.discard(instance.pk)
+
+
+# 댓글 수(comment_count) 유지
+@receiver(post_save, sender=Comment)
+def increment_comment_count(sender, instance, created, **kwargs):
+    if created:
+        Post.objects.filter(pk=instance.post_id).update(
+            comment_count=F("comment_count") + 1
+        )
+
+
+@receiver(post_delete, sender=Comment)
+def decrement_comment_count(sender, instance, **kwargs):
+    if instance.post_id in _deleting_post_pks:
+        return
+    Post.objects.filter(pk=instance.post_id, comment_count__gt=0).update(
+        comment_count=F("comment_count") - 1
+    )
+
+
+# 캐시 무효화: 바뀐 대상의 의존성 버전만 올림 (blog.dependencies 참고)
+# 호출한 쪽의 트랜잭션(쓰기 큐 묶음, 관리자 화면)이 커밋된 뒤에 올림
+@receiver(post_init, sender=Post)
+def remember_post_state(sender, instance, **kwargs):
+    # 지연 로딩(defer)된 필드는 건드리지 않도록 __dict__에서 직접 읽음
+    instance._was_published = instance.__dict__.get("is_published")
+
+
+@receiver(post_save, sender=Post)
+def bump_saved_post(sender, instance, created, **kwargs):
+    names = [deps.post(instance.pk), deps.POSTS]
+    if created or instance._was_published != instance.is_published:
+        # 목록 구성이 바뀜: 전체 목록, 태그별 목록, 태그별 게시글 수
+        names += [deps.PUBLISHED_POSTS, deps.TAGS]
+        slugs = instance.tags.values_list("slug", flat=True)
+        names += [deps.tag(slug) for slug in slugs]
+    instance._was_published = instance.is_published
+    bump_on_commit(*names)
+
+
+@receiver(pre_delete, sender=Post)
+def remember_post_tags(sender, instance, **kwargs):
+    instance._deleted_tag_slugs = list(instance.tags.values_list("slug", flat=True))
+
+
+@receiver(post_delete, sender=Post)
+def bump_deleted_post(sender, instance, **kwargs):
+    bump_on_commit(
+        deps.post(instance.pk),
+        deps.comments(instance.pk),
+        deps.POSTS,
+        deps.PUBLISHED_POSTS,
+        deps.TAGS,
+        *[deps.tag(slug) for slug in instance._deleted_tag_slugs],
+    )
+
+
+@receiver(m2m_changed, sender=Post.tags.through)
+def bump_post_tags(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse:
+        if action == "post_clear":
+            slugs = instance._cleared_tag_slugs
+        else:
+            slugs = Tag.objects.filter(pk__in=pk_set).values_list("slug", flat=True)
+        bump_on_commit(
+            deps.post(instance.pk),
+            deps.POSTS,
+            deps.TAGS,
+            *[deps.tag(slug) for slug in slugs],
+        )
+    else:
+        pks = instance._cleared_post_pks if action == "post_clear" else pk_set
+        bump_on_commit(
+            deps.tag(instance.slug),
+            deps.POSTS,
+            deps.TAGS,
+            *[deps.post(pk) for pk in pks],
+        )
+
+
+@receiver(m2m_changed, sender=Post.likes.through)
+def bump_post_likes(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse:
+        bump_on_commit(deps.post(instance.pk), deps.POSTS)
+    else:
+        pks = instance._cleared_post_pks if action == "post_clear" else pk_set
+        bump_on_commit(deps.POSTS, *[deps.post(pk) for pk in pks])
+
+
+@receiver(post_init, sender=Tag)
+def remember_tag_state(sender, instance, **kwargs):
+    instance._initial_name = instance.__dict__.get("name")
+    instance._initial_slug = instance.__dict__.get("slug")
+
+
+@receiver(post_save, sender=Tag)
+def bump_saved_tag(sender, instance, created, **kwargs):
+    # slug가 바뀌면 예전 주소의 태그 페이지도 무효화
+    names = [deps.TAGS, deps.tag(instance.slug), deps.tag(instance._initial_slug)]
+    renamed = (instance._initial_name, instance._initial_slug) != (
+        instance.name,
+        instance.slug,
+    )
+    if not created and renamed:
+        # 목록 행의 태그 배지(이름, 링크)가 바뀜
+        pks = instance.posts.values_list("pk", flat=True)
+        names += [deps.POSTS, *[deps.post(pk) for pk in pks]]
+    instance._initial_name = instance.name
+    instance._initial_slug = instance.slug
+    bump_on_commit(*names)
+
+
+@receiver(post_delete, sender=Tag)
+def bump_deleted_tag(sender, instance, **kwargs):
+    bump_on_commit(
+        deps.TAGS,
+        deps.POSTS,
+        deps.tag(instance.slug),
+        *[deps.post(pk) for pk in instance._deleted_post_pks],
+    )
+
+
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+def bump_comments(sender, instance, **kwargs):
+    # 게시글 삭제는 bump_deleted_post가 댓글 목록까지 한 번에 무효화
+    if instance.post_id in _deleting_post_pks:
+        return
+    bump_on_commit(deps.comments(instance.post_id))
@@ -0,0 +1,63 @@
+# blog/tag_cloud.py
+"""태그 클라우드와 slug → Tag 레지스트리
+
+태그 목록(공개 게시글 수 포함)은 자주 바뀌지 않으므로 한 번 계산해
+프로세스 메모리에 둡니다. 요청마다 공유 캐시(CACHE_DEPS_CACHE)의 TAGS 의존성
+버전을 확인하므로, 게시글/태그가 바뀌어 버전이 오르면(blog.signals 참고) 어느
+프로세스에서 바뀌었든 각 프로세스가 다음 요청에서 다시 읽습니다.
+"""
+import threading
+import time
+
+from django.conf import settings
+from django.db.models import Count, Q
+
+from main.cache_deps import get_version
+
+from . import dependencies as deps
+
+
+class TagRegistry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version = None
+        self._loaded_at = 0
+        self._tags = []
+        self._by_slug = {}
+
+    @property
+    def timeout(self):
+        return getattr(settings, "BLOG_TAG_CLOUD_TIMEOUT", 300)
+
+    def _ensure_loaded(self):
+        version = get_version(deps.TAGS)
+        expired = time.monotonic() - self._loaded_at > self.timeout
+        if version == self._version and not expired:
+            return
+        from .models import Tag
+
+        tags = list(
+            Tag.objects.annotate(
+                post_count=Count("posts", filter=Q(posts__is_published=True))
+            ).order_by("name")
+        )
+        with self._lock:
+            self._tags = tags
+            self._by_slug = {tag.slug: tag for tag in tags}
+            self._version = version
+            self._loaded_at = time.monotonic()
+
+    def tags(self, limit=None):
+        """전체 태그 (limit을 주면 게시글 수가 많은 순으로 상위 N개)"""
+        self._ensure_loaded()
+        if limit is None:
+            return self._tags
+        return sorted(self._tags, key=lambda tag: (-tag.post_count, tag.name))[:limit]
+
+    def get(self, slug):
+        """slug로 Tag 조회 (없으면 None)"""
+        self._ensure_loaded()
+        return self._by_slug.get(slug)
+
+
+tag_registry = TagRegistry()
@@ -0,0 +1,15 @@
+# blog/templatetags/blog_extras.py
+from django import template
+
+from blog.tag_cloud import tag_registry
+
+register = template.Library()
+
+
+@register.simple_tag
+def tag_cloud(limit=None):
+    """태그 목록 (공개 게시글 수 post_count 포함, limit을 주면 상위 N개)
+
+    사용법: {% tag_cloud 20 as tags %}
+    """
+    return tag_registry.tags(limit)
@@ -1,19 +1,12 @@
 # blog/templatetags/markdown_extras.py
 from django import template
-import markdown as md
+
+from blog.rendering import render_markdown
 
 register = template.Library()
 
 
 @register.filter(name="markdown")
 def markdown_format(text):
-    """마크다운 텍스트를 HTML로 변환"""
-    return md.markdown(
-        text,
-        extensions=[
-            "fenced_code",
-            "codehilite",
-            "tables",
-            "nl2br",
-        ],
-    )
+    """마크다운 텍스트를 HTML로 변환 (본문 해시 기준으로 캐시)"""
+    return render_markdown(text)
@@ -1,3 +1,108 @@
-from django.test import TestCase
+from datetime import datetime, timedelta, timezone
 
-# Create your tests here.
+from django.http import Http404
+from django.test import TestCase, override_settings
+
+from accounts.models import User
+
+from .models import Post
+from .pagination import KeysetPaginator, decode_cursor, encode_cursor
+
+BASE = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+@override_settings(
+    CACHES={
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+        "deps": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+        "counters": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    },
+)
+class KeysetPaginationTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        author = User.objects.create_user(username="writer", password="pw")
+        cls.posts = []
+        # 시각이 같은 글이 페이지 경계에 걸치도록 두 개씩 같은 시각으로
+        for index in range(7):
+            post = Post.objects.create(
+                author=author, title=f"글 {index}", content="본문", is_published=True
+            )
+            created_at = BASE + timedelta(minutes=index // 2)
+            Post.objects.filter(pk=post.pk).update(created_at=created_at)
+            post.created_at = created_at
+            cls.posts.append(post)
+        # 최신 글부터 (시각이 같으면 id가 큰 글부터)
+        cls.newest_first = sorted(
+            cls.posts, key=lambda post: (post.created_at, post.pk), reverse=True
+        )
+
+    def paginator(self, **kwargs):
+        return KeysetPaginator(Post.objects.all(), 3, **kwargs)
+
+    def assertPosts(self, page, posts):
+        self.assertEqual([post.pk for post in page], [post.pk for post in posts])
+
+    def test_cursor_round_trip(self):
+        post = self.posts[0]
+        self.assertEqual(decode_cursor(encode_cursor(post)), (post.created_at, post.pk))
+
+    def test_pages_forward(self):
+        paginator = self.paginator()
+        first = paginator.page()
+        self.assertPosts(first, self.newest_first[:3])
+        self.assertTrue(first.has_next())
+        self.assertFalse(first.has_previous())
+        self.assertIsNone(first.previous_cursor)
+
+        second = paginator.page(after=first.next_cursor)
+        self.assertPosts(second, self.newest_first[3:6])
+        self.assertTrue(second.has_previous())
+
+        last = paginator.page(after=second.next_cursor)
+        self.assertPosts(last, self.newest_first[6:])
+        self.assertFalse(last.has_next())
+        self.assertIsNone(last.next_cursor)
+
+    def test_pages_backward(self):
+        paginator = self.paginator()
+        second = paginator.page(after=paginator.page().next_cursor)
+        last = paginator.page(after=second.next_cursor)
+
+        previous = paginator.page(before=last.previous_cursor)
+        self.assertPosts(previous, self.newest_first[3:6])
+        self.assertTrue(previous.has_next())
+        self.assertTrue(previous.has_previous())
+
+        first = paginator.page(before=previous.previous_cursor)
+        self.assertPosts(first, self.newest_first[:3])
+        self.assertFalse(first.has_previous())
+
+    def test_ascending(self):
+        paginator = self.paginator(ascending=True)
+        first = paginator.page()
+        self.assertPosts(first, self.newest_first[::-1][:3])
+        second = paginator.page(after=first.next_cursor)
+        self.assertPosts(second, self.newest_first[::-1][3:6])
+        self.assertPosts(paginator.page(before=second.previous_cursor), first)
+
+    def test_invalid_cursor(self):
+        paginator = self.paginator()
+        for cursor in ["abc", "1-2-3", "1.5-2", "9" * 30 + "-1"]:
+            with self.subTest(cursor=cursor):
+                with self.assertRaises(Http404):
+                    paginator.page(after=cursor)
+                with self.assertRaises(Http404):
+                    paginator.page(before=cursor)
+
+    def test_list_view_cursors(self):
+        response = self.client.get("/blog/", {"after": "잘못된-커서"})
+        self.assertEqual(response.status_code, 404)
+
+        first = self.paginator().page()
+        response = self.client.get("/blog/", {"after": first.next_cursor})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [post.pk for post in response.context["posts"]],
+            [post.pk for post in self.newest_first[3:]],
+        )
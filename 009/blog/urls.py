@@ -10,7 +10,13 @@ urlpatterns = [
     path("<int:pk>/", views.PostDetailView.as_view(), name="post_detail"),
     path("<int:pk>/update/", views.PostUpdateView.as_view(), name="post_update"),
     path("<int:pk>/delete/", views.PostDeleteView.as_view(), name="post_delete"),
+    path("<int:pk>/like/", views.PostLikeView.as_view(), name="post_like"),
     path("tag/<str:slug>/", views.PostByTagListView.as_view(), name="post_by_tag"),
+    path(
+        "<int:post_pk>/comments/",
+        views.CommentListView.as_view(),
+        name="comment_list",
+    ),
     path(
         "<int:post_pk>/comment/create/",
         views.CommentCreateView.as_view(),
@@ -1,5 +1,6 @@
 # blog/views.py
 from django.views.generic import (
+    View,
     ListView,
     DetailView,
     CreateView,
@@ -7,65 +8,145 @@ from django.views.generic import (
     DeleteView,
 )
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
-from django.shortcuts import get_object_or_404
+from django.http import Http404, JsonResponse
+from django.shortcuts import get_object_or_404, redirect
+from django.template.loader import render_to_string
 from django.urls import reverse_lazy
-from django.db.models import Q
-from .models import Post, Tag, Comment
+from django.conf import settings
+from main.cache_deps import bump, changed_at, depends_on, get_versions
+from main.conditional import ConditionalGetMixin
+from main.write_queue import write_queue
+
+from . import dependencies as deps
+from .counters import view_counter
+from .models import Post, Comment
 from .forms import PostForm, CommentForm
+from .pagination import KeysetPaginationMixin, KeysetPaginator
+from .rendering import renderer_version
+from .search import make_snippet, search_posts
+from .tag_cloud import tag_registry
+
+
+class PostRowsMixin:
+    """게시글 목록 행(blog/includes/post_row.html) 조각 캐시에 필요한 값 준비
+
+    행은 게시글 버전(blog.dependencies.post)을 키에 넣어 캐시하므로
+    좋아요 수처럼 updated_at을 바꾸지 않는 변경도 반영됩니다.
+    """
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        names = [deps.post(post.pk) for post in context["posts"]]
+        depends_on(self.request, *names)
+        versions = get_versions(names)
+        for post in context["posts"]:
+            post.row_version = versions[deps.post(post.pk)]
+        context["row_cache_timeout"] = getattr(
+            settings, "BLOG_POST_ROW_CACHE_TIMEOUT", 300
+        )
+        return context
 
 
 # 게시글 목록
-class PostListView(ListView):
+class PostListView(
+    ConditionalGetMixin, PostRowsMixin, KeysetPaginationMixin, ListView
+):
     model = Post
     template_name = "blog/post_list.html"
     context_object_name = "posts"
     paginate_by = 10
 
+    def get_validators(self):
+        versions = get_versions([deps.PUBLISHED_POSTS, deps.POSTS, deps.TAGS])
+        return list(versions.values()), changed_at(versions.values())
+
+    def get_pagination_mode(self):
+        # 검색 결과는 관련도 순이라 커서 방식 대신 번호 페이지네이션 사용
+        if self.request.GET.get("search"):
+            return "page"
+        return super().get_pagination_mode()
+
     def get_queryset(self):
+        # 페이지 캐시 의존성: 공개 글 목록 구성, 태그 클라우드 (표시된 글은 PostRowsMixin)
+        depends_on(self.request, deps.PUBLISHED_POSTS, deps.TAGS)
         queryset = (
             Post.objects.filter(is_published=True)
             .select_related("author")
             .prefetch_related("tags")
         )
 
-        # 검색 기능
+        # 검색 기능 (FTS5 색인, 관련도 순)
+        # 목록에는 미리 계산한 excerpt만 쓰므로 본문 컬럼은 읽지 않음
         search = self.request.GET.get("search", "")
         if search:
-            queryset = queryset.filter(
-                Q(title__icontains=search) | Q(content__icontains=search)
-            )
+            # 검색 결과 스니펫은 렌더링된 본문(content_html)에서 만듦
+            return search_posts(queryset, search).defer("content")
 
-        return queryset
+        return queryset.defer("content", "content_html")
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context["all_tags"] = Tag.objects.all()
         context["search"] = self.request.GET.get("search", "")
+        if context["search"]:
+            for post in context["posts"]:
+                post.search_snippet = make_snippet(post, context["search"])
         return context
 
 
 # 게시글 상세
-class PostDetailView(DetailView):
+class PostDetailView(ConditionalGetMixin, DetailView):
     model = Post
     template_name = "blog/post_detail.html"
     context_object_name = "post"
+    comments_paginate_by = 20
+
+    def get_validators(self):
+        # 수정 시각 + 댓글/좋아요/태그 버전 (본문이나 Markdown은 읽지 않음)
+        pk = self.kwargs[self.pk_url_kwarg]
+        updated_at = (
+            Post.objects.filter(pk=pk, is_published=True)
+            .values_list("updated_at", flat=True)
+            .first()
+        )
+        if updated_at is None:
+            return None
+        versions = get_versions([deps.post(pk), deps.comments(pk), deps.TAGS])
+        parts = [updated_at.isoformat(), renderer_version(), *versions.values()]
+        return parts, max(updated_at, changed_at(versions.values()))
+
+    def not_modified(self):
+        view_counter.record(int(self.kwargs[self.pk_url_kwarg]))
 
     def get_queryset(self):
         return (
             Post.objects.filter(is_published=True)
             .select_related("author")
-            .prefetch_related("tags", "comments__author")
+            .prefetch_related("tags")
         )
 
     def get_object(self, queryset=None):
+        pk = self.kwargs[self.pk_url_kwarg]
+        depends_on(self.request, deps.post(pk), deps.comments(pk), deps.TAGS)
         obj = super().get_object(queryset)
         # 조회수 증가
         obj.increment_view_count()
         return obj
 
+    @classmethod
+    def page_cache_hit(cls, request, pk):
+        # 캐시된 페이지를 보여줄 때도 조회수는 올림
+        view_counter.record(pk)
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context["comment_form"] = CommentForm()
+        context["is_liked"] = self.object.is_liked_by(self.request.user)
+        # 댓글은 첫 페이지만 읽고 나머지는 CommentListView로 이어서 불러옴
+        context["comments_page"] = KeysetPaginator(
+            self.object.comments.select_related("author"),
+            self.comments_paginate_by,
+            ascending=True,
+        ).page()
         return context
 
 
@@ -102,28 +183,87 @@ class PostDeleteView(LoginRequiredMixin, UserPassesTestMixin, DeleteView):
         return self.request.user == post.author
 
 
+# 좋아요 / 좋아요 취소
+class PostLikeView(LoginRequiredMixin, View):
+    """action=like|unlike 로 상태를 지정하므로 여러 번 눌러도 결과가 같습니다.
+    action이 없으면 현재 상태를 뒤집습니다."""
+
+    http_method_names = ["post"]
+
+    def post(self, request, pk):
+        post = get_object_or_404(Post, pk=pk, is_published=True)
+        action = request.POST.get("action")
+        if action not in ("like", "unlike"):
+            action = "unlike" if post.is_liked_by(request.user) else "like"
+
+        # 쓰기는 쓰기 큐에서 다른 요청의 쓰기와 묶어 커밋
+        if action == "like":
+            changed = write_queue.run(post.add_like, request.user)
+        else:
+            changed = write_queue.run(post.remove_like, request.user)
+        if changed:
+            # add_like/remove_like는 m2m 시그널을 거치지 않으므로 직접 무효화
+            bump(deps.post(post.pk), deps.POSTS)
+
+        if request.headers.get("x-requested-with") != "XMLHttpRequest":
+            return redirect(post)
+        post.refresh_from_db(fields=["like_count"])
+        return JsonResponse(
+            {"liked": action == "like", "like_count": post.like_count}
+        )
+
+
 # 태그별 게시글 목록
-class PostByTagListView(ListView):
+class PostByTagListView(
+    ConditionalGetMixin, PostRowsMixin, KeysetPaginationMixin, ListView
+):
     model = Post
     template_name = "blog/post_list_by_tag.html"
     context_object_name = "posts"
     paginate_by = 10
 
+    def get_validators(self):
+        names = [deps.tag(self.kwargs["slug"]), deps.POSTS, deps.TAGS]
+        versions = get_versions(names)
+        return list(versions.values()), changed_at(versions.values())
+
     def get_queryset(self):
-        self.tag = get_object_or_404(Tag, slug=self.kwargs["slug"])
+        depends_on(self.request, deps.tag(self.kwargs["slug"]), deps.TAGS)
+        self.tag = tag_registry.get(self.kwargs["slug"])
+        if self.tag is None:
+            raise Http404("존재하지 않는 태그입니다.")
         return (
             Post.objects.filter(tags=self.tag, is_published=True)
             .select_related("author")
             .prefetch_related("tags")
+            .defer("content", "content_html")
         )
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context["tag"] = self.tag
-        context["all_tags"] = Tag.objects.all()
         return context
 
 
+# 댓글 목록 (더 보기)
+class CommentListView(View):
+    """?after=<커서> 다음 댓글들을 HTML 조각과 다음 커서로 반환"""
+
+    paginate_by = 20
+
+    def get(self, request, post_pk):
+        post = get_object_or_404(Post, pk=post_pk, is_published=True)
+        page = KeysetPaginator(
+            post.comments.select_related("author"), self.paginate_by, ascending=True
+        ).page(after=request.GET.get("after"))
+        html = render_to_string(
+            "blog/includes/comment_list.html",
+            {"comments": page.object_list},
+            request=request,
+        )
+        return JsonResponse({"html": html, "next_cursor": page.next_cursor})
+
+
 # 댓글 작성
 class CommentCreateView(LoginRequiredMixin, CreateView):
     model = Comment
@@ -134,7 +274,8 @@ class CommentCreateView(LoginRequiredMixin, CreateView):
         post = get_object_or_404(Post, pk=self.kwargs["post_pk"])
         form.instance.author = self.request.user
         form.instance.post = post
-        return super().form_valid(form)
+        self.object = write_queue.run(form.save)
+        return redirect(self.get_success_url())
 
     def get_success_url(self):
         return self.object.post.get_absolute_url()
@@ -44,6 +44,7 @@ INSTALLED_APPS = [
     "main",  # 추가
     "accounts",  # 추가
     "blog",  # 추가
+    "jobs",  # 추가
 ]
 
 AUTH_USER_MODEL = "accounts.User"
@@ -56,17 +57,19 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "main.page_cache.PageCacheMiddleware",  # 추가
 ]
 
 ROOT_URLCONF = "config.urls"
 
 import os
+import tempfile
 
 TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
         "DIRS": [os.path.join(BASE_DIR, "templates")],  # 이 부분 수정
-        "APP_DIRS": True,
+        "APP_DIRS": False,  # loaders를 직접 지정 (app_directories 포함)
         "OPTIONS": {
             "context_processors": [
                 "django.template.context_processors.debug",
@@ -74,10 +77,23 @@ TEMPLATES = [
                 "django.contrib.auth.context_processors.auth",
                 "django.contrib.messages.context_processors.messages",
             ],
+            # 한 번 읽어 공백을 줄이고 컴파일한 템플릿을 캐시 (main/template_loaders.py)
+            "loaders": [
+                (
+                    "main.template_loaders.Loader",
+                    [
+                        "django.template.loaders.filesystem.Loader",
+                        "django.template.loaders.app_directories.Loader",
+                    ],
+                ),
+            ],
         },
     },
 ]
 
+# 서버 시작 때(config.wsgi) 프로젝트 템플릿을 미리 컴파일
+TEMPLATE_WARMUP = True
+
 WSGI_APPLICATION = "config.wsgi.application"
 
 
@@ -86,12 +102,123 @@ WSGI_APPLICATION = "config.wsgi.application"
 
 DATABASES = {
     "default": {
-        "ENGINE": "django.db.backends.sqlite3",
+        # WAL 등 운영용 PRAGMA를 적용하는 sqlite3 백엔드 (config/sqlite/base.py)
+        "ENGINE": "config.sqlite",
         "NAME": BASE_DIR / "db.sqlite3",
+        # 요청마다 새로 연결하지 않고 재사용 (끊긴 연결은 요청 시작 시 확인)
+        "CONN_MAX_AGE": 600,
+        "CONN_HEALTH_CHECKS": True,
+        "OPTIONS": {
+            # 트랜잭션 시작 시 쓰기 잠금을 잡아, 읽다가 쓰기로 바꿀 때
+            # busy_timeout을 무시하고 바로 "database is locked"가 나는 일을 막음
+            "transaction_mode": "IMMEDIATE",
+            # 기본값: config.sqlite.base.DEFAULT_PRAGMAS
+            "pragmas": {},
+        },
     }
 }
 
 
+# 쓰기 큐 (main/write_queue.py): 댓글 작성, 좋아요, 카운터 반영을 한 스레드에서 묶어 커밋
+WRITE_QUEUE_ENABLED = True
+WRITE_QUEUE_BATCH_SIZE = 100
+WRITE_QUEUE_BATCH_WINDOW = 0.002  # 묶음을 모으려고 기다리는 최대 시간(초)
+WRITE_QUEUE_TIMEOUT = 10  # 요청이 커밋을 기다리는 최대 시간(초)
+
+
+# 작업 큐 (jobs 앱, 워커: python manage.py run_jobs)
+JOBS_EAGER = DEBUG  # True면 워커 없이 요청 커밋 직후 바로 실행 (개발용)
+JOBS_VISIBILITY_TIMEOUT = 300  # 실행 중인 작업을 다른 워커가 다시 가져가기까지(초)
+JOBS_KEEP_FINISHED_DAYS = 7
+
+
+# 업로드 이미지 파생 이미지(WebP/JPEG) 너비 (main/imaging.py, 원본보다 크게 만들지 않음)
+IMAGE_VARIANT_PRESETS = {
+    "thumbnail": [480, 960, 1600],
+    "avatar": [64, 128, 256],
+}
+
+# 참조가 끊긴 업로드 파일 정리 (python manage.py collect_media_garbage, 작업 큐에서 1시간마다)
+MEDIA_GC_GRACE_HOURS = 24  # 업로드 직후(아직 저장 전) 파일을 지우지 않도록 두는 유예 시간
+MEDIA_GC_TRASH_DAYS = 7  # 휴지통(MEDIA_ROOT/.trash)에 보관하는 기간
+MEDIA_GC_BATCH_SIZE = 200
+MEDIA_GC_BATCH_SLEEP = 0.2  # 묶음 사이에 쉬는 시간(초) - 디스크 I/O 제한
+MEDIA_GC_MAX_FILES = 5000  # 한 번 실행에서 확인할 최대 파일 수 (다음 실행에서 이어서)
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+
+CACHES = {
+    # 페이지 캐시 등 캐시 항목 (페이지 수만큼 늘어나므로 기본값(300)보다 넉넉하게)
+    # 모든 웹 워커와 작업 워커(run_jobs)가 함께 봐야 하므로 프로세스 간 공유 캐시를
+    # 사용 (서버가 여러 대면 Redis/Memcached로 교체)
+    "default": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.path.join(tempfile.gettempdir(), "vibecoding_blog_cache"),
+        "OPTIONS": {"MAX_ENTRIES": 5000},
+    },
+    # 의존성 버전 키 (main/cache_deps.py), 캐시 항목이 많아져 정리(cull)될 때 함께
+    # 지워지지 않도록 따로 둠. 키 수는 글/태그 수 정도라 사실상 정리되지 않게 잡음
+    "deps": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.path.join(tempfile.gettempdir(), "vibecoding_blog_cache_deps"),
+        "TIMEOUT": None,
+        "OPTIONS": {"MAX_ENTRIES": 1000000},
+    },
+    # 조회수 등 카운터 버퍼 (증가가 원자적이어야 하므로 파일 캐시는 쓰지 않음)
+    # 프로세스별 버퍼는 각 웹 프로세스가 직접 플러시하고, flush_view_counts 명령과
+    # 작업 워커의 주기 플러시는 Redis/Memcached로 교체했을 때만 동작 (blog/counters.py)
+    "counters": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "blog-counters",
+        "TIMEOUT": None,
+        "OPTIONS": {"MAX_ENTRIES": 100000},
+    },
+}
+
+# 의존성 버전 키를 담는 CACHES 별칭
+CACHE_DEPS_CACHE = "deps"
+
+# 조회수 버퍼 설정
+BLOG_VIEW_COUNT_CACHE = "counters"
+BLOG_VIEW_COUNT_FLUSH_INTERVAL = 10  # 초 (0이면 주기 플러시 없이 임계값에서만)
+BLOG_VIEW_COUNT_FLUSH_THRESHOLD = 100  # 이 횟수만큼 쌓이면 즉시 플러시
+
+
+# 마크다운 렌더 캐시 설정
+BLOG_MARKDOWN_CACHE_SIZE = 256  # 프로세스 내 LRU 항목 수
+BLOG_MARKDOWN_CACHE = None  # 영속 캐시로 쓸 CACHES 별칭 (예: 파일 캐시), None이면 사용 안 함
+BLOG_RENDER_IN_BACKGROUND = True  # 게시글 저장 시 렌더링을 작업 큐(jobs)로 넘김
+
+
+# 태그 클라우드 캐시 유지 시간(초) - 변경 시에는 시그널로 즉시 무효화됩니다.
+BLOG_TAG_CLOUD_TIMEOUT = 300
+
+# 게시글 목록 행 조각 캐시 유지 시간(초) - 조회수처럼 버전을 올리지 않는 값이 반영되는 주기
+BLOG_POST_ROW_CACHE_TIMEOUT = 300
+
+# 게시글 목록 페이지네이션: "keyset"(커서, COUNT 없음) 또는 "page"(번호)
+BLOG_PAGINATION_MODE = "keyset"
+
+
+# 전체 페이지 캐시 (익명 기준 본문 공유, 사용자별 영역은 /fragments/에서 채움)
+PAGE_CACHE_VIEWS = [
+    "main:home",
+    "main:about",
+    "main:contact",
+    "blog:post_list",
+    "blog:post_by_tag",
+    "blog:post_detail",
+]
+PAGE_CACHE_TIMEOUT = 300  # 초
+# 캐시 키에 넣는 쿼리 파라미터 (캐시하는 뷰가 읽는 것만, 나머지는 무시)
+PAGE_CACHE_QUERY_PARAMS = ["search", "after", "before", "page"]
+PAGE_CACHE_AUTH_COOKIE = "logged_in"  # 이름을 바꾸면 base.html 스크립트도 함께 수정
+# 배포 식별자 (ETag와 페이지 캐시 키에 들어감), None이면 staticfiles 매니페스트의 해시
+BUILD_ID = None
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -129,11 +256,38 @@ STATICFILES_DIRS = [
     os.path.join(BASE_DIR, "static"),
 ]
 STATIC_ROOT = os.path.join(BASE_DIR, "staticfiles")
+# config.wsgi에서 STATIC_ROOT 파일을 직접 서빙 (해시 이름은 1년 + immutable 캐시)
+STATIC_SERVE_ENABLED = True
+STATIC_SERVE_MAX_AGE = 60  # 해시가 없는 이름(원본 이름)의 브라우저 캐시 시간(초)
+# collectstatic에서 너비별 AVIF/WebP/JPEG 사본을 만들 배경 이미지 ({% static_background %})
+STATIC_IMAGE_VARIANT_PATTERNS = ["assets/img/*-bg.jpg"]
+STATIC_IMAGE_VARIANT_WIDTHS = [640, 1280, 1920]
+# collectstatic에서 템플릿에 나오지 않는 규칙을 뺀 CSS 사본과 critical CSS 생성 ({% stylesheet %})
+CSS_PURGE_STYLESHEETS = ["css/styles.css"]
+CSS_PURGE_CONTENT = [  # 사용 중인 클래스 이름을 찾을 파일 (BASE_DIR 기준)
+    "templates/**/*.html",
+    "blog/forms.py",
+    "accounts/forms.py",
+    "main/templatetags/*.py",  # 태그가 만드는 <picture>, <img> 등
+    "static/js/*.js",
+]
+CSS_PURGE_SAFELIST = ["show", "collapsing", "svg"]  # Bootstrap JS 등이 붙이는 이름
+CSS_CRITICAL_TEMPLATES = ["templates/**/*.html"]  # {# critical-css #} 구간을 찾을 파일
 
 # Media files (User uploaded files)
 MEDIA_URL = "/media/"
 MEDIA_ROOT = os.path.join(BASE_DIR, "media")
 
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    # collectstatic: 내용 해시 이름 + 매니페스트 + .gz(.br) 압축본 (main/static_files.py)
+    "staticfiles": {
+        "BACKEND": "main.static_files.CompressedManifestStaticFilesStorage",
+    },
+    # 썸네일/프로필 이미지: 내용 해시로 이름을 정하고 같은 파일은 한 번만 저장
+    "uploads": {"BACKEND": "main.storage.ContentAddressedStorage"},
+}
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
@@ -0,0 +1,48 @@
+# config/sqlite/base.py
+"""운영용 SQLite 데이터베이스 백엔드
+
+기본 sqlite3 백엔드에 연결마다 PRAGMA 설정을 더합니다.
+
+- journal_mode=WAL: 읽기와 쓰기가 서로를 막지 않음 (읽는 쪽은 쓰기를 기다리지 않음)
+- synchronous=NORMAL: WAL에서는 안전하면서 커밋마다 fsync하지 않음
+- busy_timeout: 다른 워커가 쓰는 중이면 "database is locked" 대신 기다림
+- mmap_size / cache_size / temp_store: 읽기와 임시 정렬을 메모리에서 처리
+
+OPTIONS의 "pragmas"로 값을 바꾸거나 추가할 수 있습니다.
+연결이 닫힐 때 PRAGMA optimize로 쿼리 플래너 통계를 갱신합니다.
+주기적인 optimize와 WAL 체크포인트는 sqlite_maintenance 명령이 맡습니다.
+"""
+from django.db.backends.sqlite3 import base
+
+DEFAULT_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": 5000,  # 밀리초
+    "mmap_size": 128 * 1024 * 1024,
+    "cache_size": -20000,  # 음수는 KiB 단위 (약 20MB)
+    "temp_store": "MEMORY",
+}
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    def get_connection_params(self):
+        kwargs = super().get_connection_params()
+        self.pragmas = {**DEFAULT_PRAGMAS, **kwargs.pop("pragmas", {})}
+        return kwargs
+
+    def get_new_connection(self, conn_params):
+        conn = super().get_new_connection(conn_params)
+        for name, value in self.pragmas.items():
+            conn.execute(f"PRAGMA {name} = {value}")
+        # 오래 유지되는 연결용: 통계가 없는 테이블만 가볍게 분석
+        conn.execute("PRAGMA optimize = 0x10002")
+        return conn
+
+    def _close(self):
+        if self.connection is not None and not self.in_atomic_block:
+            try:
+                self.connection.execute("PRAGMA optimize")
+            except self.Database.Error:
+                # 다른 워커가 쓰는 중이면 다음 기회에
+                pass
+        super()._close()
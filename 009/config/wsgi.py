@@ -9,8 +9,21 @@ https://docs.djangoproject.com/en/5.2/howto/deployment/wsgi/
 
 import os
 
+from django.conf import settings
 from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 
 application = get_wsgi_application()
+
+# 첫 요청에서 템플릿을 파싱하지 않도록 미리 컴파일 (main/template_loaders.py)
+if getattr(settings, 'TEMPLATE_WARMUP', True):
+    from main.template_loaders import warm_templates
+
+    warm_templates()
+
+# 정적 파일은 Django를 거치지 않고 STATIC_ROOT에서 바로 응답 (main/static_files.py)
+if getattr(settings, 'STATIC_SERVE_ENABLED', True):
+    from main.static_files import StaticFilesApp
+
+    application = StaticFilesApp(application)
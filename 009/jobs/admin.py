@@ -0,0 +1,34 @@
+# jobs/admin.py
+from django.contrib import admin, messages
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from .models import Job
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = [
+        "name",
+        "status",
+        "priority",
+        "run_at",
+        "attempts",
+        "finished_at",
+    ]
+    list_filter = ["status", "name"]
+    search_fields = ["name", "unique_key", "last_error"]
+    readonly_fields = ["locked_until", "locked_by", "created_at", "finished_at"]
+    actions = ["requeue"]
+
+    @admin.action(description="선택한 작업 다시 실행")
+    def requeue(self, request, queryset):
+        try:
+            with transaction.atomic():
+                queryset.exclude(status=Job.RUNNING).update(
+                    status=Job.QUEUED, attempts=0, run_at=timezone.now(), last_error=""
+                )
+        except IntegrityError:
+            self.message_user(
+                request, "같은 키의 작업이 이미 대기 중입니다.", messages.ERROR
+            )
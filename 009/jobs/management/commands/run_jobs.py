@@ -0,0 +1,34 @@
+# jobs/management/commands/run_jobs.py
+import signal
+
+from django.core.management.base import BaseCommand
+
+from jobs.worker import Worker
+
+
+class Command(BaseCommand):
+    help = "작업 큐 워커를 실행합니다. (SIGTERM/Ctrl+C: 실행 중인 작업을 마치고 종료)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--threads", type=int, default=4, help="동시에 실행할 작업 수"
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=1.0,
+            help="실행할 작업이 없을 때 다시 확인하는 간격(초)",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="지금 실행할 수 있는 작업을 모두 처리하면 종료",
+        )
+
+    def handle(self, *args, **options):
+        worker = Worker(options["threads"], options["poll_interval"])
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signum, lambda *_: worker.stop())
+        self.stdout.write(f"워커 시작: {worker.name} (스레드 {worker.threads}개)")
+        worker.run(once=options["once"])
+        self.stdout.write("워커 종료")
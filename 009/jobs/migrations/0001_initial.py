@@ -0,0 +1,41 @@
+# Generated by Django 5.2.8 on 2026-10-18 16:30
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Job',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, verbose_name='작업 이름')),
+                ('kwargs', models.JSONField(blank=True, default=dict, verbose_name='인자')),
+                ('status', models.CharField(choices=[('queued', '대기'), ('running', '실행 중'), ('done', '완료'), ('failed', '실패')], default='queued', max_length=10, verbose_name='상태')),
+                ('priority', models.SmallIntegerField(default=0, verbose_name='우선순위')),
+                ('run_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='실행 예정 시각')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='시도 횟수')),
+                ('max_attempts', models.PositiveSmallIntegerField(default=3, verbose_name='최대 시도 횟수')),
+                ('locked_until', models.DateTimeField(blank=True, null=True, verbose_name='잠금 만료')),
+                ('locked_by', models.CharField(blank=True, max_length=100, verbose_name='실행 워커')),
+                ('unique_key', models.CharField(blank=True, max_length=200, null=True, verbose_name='중복 방지 키')),
+                ('last_error', models.TextField(blank=True, verbose_name='마지막 오류')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='완료 시각')),
+            ],
+            options={
+                'verbose_name': '작업',
+                'verbose_name_plural': '작업 목록',
+                'ordering': ['-priority', 'run_at'],
+                'indexes': [models.Index(fields=['status', '-priority', 'run_at'], name='jobs_job_pick_idx')],
+                'constraints': [models.UniqueConstraint(condition=models.Q(('status', 'queued')), fields=('unique_key',), name='jobs_job_unique_queued')],
+            },
+        ),
+    ]
@@ -0,0 +1,57 @@
+# jobs/models.py
+from django.db import models
+from django.utils import timezone
+
+
+class Job(models.Model):
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    STATUS_CHOICES = [
+        (QUEUED, "대기"),
+        (RUNNING, "실행 중"),
+        (DONE, "완료"),
+        (FAILED, "실패"),
+    ]
+
+    name = models.CharField(max_length=100, verbose_name="작업 이름")
+    kwargs = models.JSONField(default=dict, blank=True, verbose_name="인자")
+    status = models.CharField(
+        max_length=10, choices=STATUS_CHOICES, default=QUEUED, verbose_name="상태"
+    )
+    priority = models.SmallIntegerField(default=0, verbose_name="우선순위")
+    run_at = models.DateTimeField(default=timezone.now, verbose_name="실행 예정 시각")
+    attempts = models.PositiveSmallIntegerField(default=0, verbose_name="시도 횟수")
+    max_attempts = models.PositiveSmallIntegerField(default=3, verbose_name="최대 시도 횟수")
+    # 실행 중인 작업을 이 시각까지 다른 워커가 가져가지 않음 (워커가 죽으면 다시 실행)
+    locked_until = models.DateTimeField(null=True, blank=True, verbose_name="잠금 만료")
+    locked_by = models.CharField(max_length=100, blank=True, verbose_name="실행 워커")
+    # 같은 키로 대기 중인 작업은 하나만 둠 (중복 등록 방지, 주기 작업)
+    unique_key = models.CharField(
+        max_length=200, null=True, blank=True, verbose_name="중복 방지 키"
+    )
+    last_error = models.TextField(blank=True, verbose_name="마지막 오류")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일")
+    finished_at = models.DateTimeField(null=True, blank=True, verbose_name="완료 시각")
+
+    class Meta:
+        ordering = ["-priority", "run_at"]
+        verbose_name = "작업"
+        verbose_name_plural = "작업 목록"
+        indexes = [
+            # 워커가 실행할 작업을 고르는 순서
+            models.Index(
+                fields=["status", "-priority", "run_at"], name="jobs_job_pick_idx"
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["unique_key"],
+                condition=models.Q(status="queued"),
+                name="jobs_job_unique_queued",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.get_status_display()})"
@@ -0,0 +1,196 @@
+# jobs/queue.py
+"""DB 테이블 기반 작업 큐
+
+각 앱의 jobs.py에서 @task로 작업 함수를 등록하고, enqueue()로 실행을 요청합니다.
+실행은 manage.py run_jobs 워커가 맡습니다. (JOBS_EAGER=True면 커밋 직후 바로 실행)
+
+    # blog/jobs.py
+    @task("blog.render_post", priority=10)
+    def render_post(post_id):
+        ...
+
+    enqueue("blog.render_post", post_id=post.pk, unique_key=f"render_post:{post.pk}")
+"""
+import logging
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .models import Job
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Task:
+    name: str
+    func: object
+    priority: int = 0
+    max_attempts: int = 3
+    retry_delay: float = 10  # 초, 시도할 때마다 두 배
+    timeout: float = None  # 초, 이 시간이 지나면 다른 워커가 다시 실행
+    every: float = None  # 초, 주기 작업이면 실행 간격
+
+    @property
+    def visibility_timeout(self):
+        return self.timeout or getattr(settings, "JOBS_VISIBILITY_TIMEOUT", 300)
+
+
+TASKS = {}
+
+
+def task(name, **options):
+    """작업 함수 등록 데코레이터 (options: Task 필드)"""
+
+    def decorator(func):
+        TASKS[name] = Task(name, func, **options)
+        return func
+
+    return decorator
+
+
+def enqueue(
+    name, *, delay=None, run_at=None, priority=None, unique_key=None, **kwargs
+):
+    """작업 실행 요청
+
+    kwargs는 JSON으로 저장되므로 모델 객체 대신 pk를 넘깁니다.
+    unique_key가 같은 작업이 이미 대기 중이면 새로 만들지 않고 None을 반환합니다.
+    """
+    spec = TASKS[name]
+    if getattr(settings, "JOBS_EAGER", False):
+        # 워커 없이 실행 (개발용): 호출자의 트랜잭션이 커밋된 뒤 바로 실행
+        transaction.on_commit(lambda: _run_eager(spec, kwargs))
+        return None
+
+    if run_at is None:
+        run_at = timezone.now() + timedelta(seconds=delay or 0)
+    try:
+        with transaction.atomic():
+            return Job.objects.create(
+                name=name,
+                kwargs=kwargs,
+                priority=spec.priority if priority is None else priority,
+                max_attempts=spec.max_attempts,
+                run_at=run_at,
+                unique_key=unique_key,
+            )
+    except IntegrityError:
+        if unique_key is None:
+            raise
+        return None
+
+
+def _run_eager(spec, kwargs):
+    try:
+        spec.func(**kwargs)
+    except Exception:
+        logger.exception("작업 실패: %s", spec.name)
+
+
+def schedule_periodic():
+    """주기 작업마다 대기 중인 작업이 하나씩 있도록 등록"""
+    for spec in TASKS.values():
+        if spec.every is None:
+            continue
+        key = f"periodic:{spec.name}"
+        pending = Job.objects.filter(
+            unique_key=key, status__in=[Job.QUEUED, Job.RUNNING]
+        )
+        if not pending.exists():
+            enqueue(spec.name, unique_key=key)
+
+
+def claim(limit, worker):
+    """실행할 작업을 최대 limit개 가져와 실행 중으로 표시
+
+    대기 중이고 실행 시각이 된 작업, 또는 잠금이 만료된(워커가 죽은) 실행 중 작업을
+    우선순위 순으로 고릅니다. 다른 워커와 동시에 고르더라도 상태와 시도 횟수가
+    그대로인 경우에만 가져가므로 한 작업은 한 워커만 실행합니다.
+    """
+    now = timezone.now()
+    candidates = Job.objects.filter(
+        Q(status=Job.QUEUED, run_at__lte=now)
+        | Q(status=Job.RUNNING, locked_until__lt=now)
+    ).order_by("-priority", "run_at", "pk")[: limit * 2]
+
+    claimed = []
+    for job in candidates:
+        spec = TASKS.get(job.name)
+        timeout = spec.visibility_timeout if spec else 0
+        updated = Job.objects.filter(
+            pk=job.pk, status=job.status, attempts=job.attempts
+        ).update(
+            status=Job.RUNNING,
+            attempts=F("attempts") + 1,
+            locked_by=worker,
+            locked_until=now + timedelta(seconds=timeout),
+        )
+        if updated:
+            job.status = Job.RUNNING
+            job.attempts += 1
+            claimed.append(job)
+            if len(claimed) >= limit:
+                break
+    return claimed
+
+
+def run_job(job):
+    """가져온 작업 하나를 실행하고 결과(완료/재시도/실패)를 기록"""
+    spec = TASKS.get(job.name)
+    if spec is None:
+        _finish(job, Job.FAILED, f"등록되지 않은 작업입니다: {job.name}")
+        return
+    if job.attempts > job.max_attempts:
+        # 실행 도중 워커가 죽어 잠금이 만료되기를 반복한 작업
+        _finish(job, Job.FAILED, job.last_error or "잠금 만료로 재시도 횟수 초과")
+        return
+
+    try:
+        spec.func(**job.kwargs)
+    except Exception as exc:
+        logger.exception("작업 실패: %s (시도 %d회)", job.name, job.attempts)
+        error = f"{type(exc).__name__}: {exc}"
+        if job.attempts < job.max_attempts:
+            delay = spec.retry_delay * 2 ** (job.attempts - 1)
+            _retry(job, error, timezone.now() + timedelta(seconds=delay))
+        else:
+            _finish(job, Job.FAILED, error)
+    else:
+        _finish(job, Job.DONE)
+
+    if spec.every is not None:
+        enqueue(
+            spec.name,
+            delay=spec.every,
+            unique_key=f"periodic:{spec.name}",
+        )
+
+
+def _finish(job, status, error=""):
+    Job.objects.filter(pk=job.pk).update(
+        status=status, last_error=error, locked_until=None, finished_at=timezone.now()
+    )
+
+
+def _retry(job, error, run_at):
+    try:
+        with transaction.atomic():
+            Job.objects.filter(pk=job.pk).update(
+                status=Job.QUEUED, last_error=error, locked_until=None, run_at=run_at
+            )
+    except IntegrityError:
+        # 같은 키의 작업이 새로 대기 중이면 그 작업이 대신 실행됨
+        _finish(job, Job.FAILED, f"{error} (새 작업으로 대체됨)")
+
+
+def delete_finished(older_than):
+    """완료된 지 older_than(timedelta)이 지난 작업 삭제, 삭제한 수 반환"""
+    deleted, _ = Job.objects.filter(
+        status=Job.DONE, finished_at__lt=timezone.now() - older_than
+    ).delete()
+    return deleted
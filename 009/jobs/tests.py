@@ -0,0 +1,108 @@
+from datetime import timedelta
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from .models import Job
+from .queue import TASKS, claim, enqueue, run_job, task
+
+
+@override_settings(JOBS_EAGER=False)
+class QueueTest(TestCase):
+    def setUp(self):
+        self.calls = []
+        self.failures = 0
+
+        def record(**kwargs):
+            self.calls.append(kwargs)
+            if self.failures:
+                self.failures -= 1
+                raise RuntimeError("실패")
+
+        task("tests.record", max_attempts=3, retry_delay=10)(record)
+        self.addCleanup(TASKS.pop, "tests.record")
+
+    def claim_due(self, job):
+        """재시도 대기 시간을 건너뛰고 다시 가져옴"""
+        Job.objects.filter(pk=job.pk).update(run_at=timezone.now())
+        (claimed,) = claim(1, "worker")
+        return claimed
+
+    def test_claim_by_priority_once(self):
+        low = enqueue("tests.record", priority=0)
+        high = enqueue("tests.record", priority=5)
+        enqueue("tests.record", delay=60)  # 아직 실행 시각 전
+
+        self.assertEqual([job.pk for job in claim(1, "a")], [high.pk])
+        self.assertEqual([job.pk for job in claim(5, "b")], [low.pk])
+        self.assertEqual(claim(5, "c"), [])
+
+        high.refresh_from_db()
+        self.assertEqual(high.status, Job.RUNNING)
+        self.assertEqual(high.attempts, 1)
+        self.assertEqual(high.locked_by, "a")
+
+    def test_claim_expired_lock(self):
+        job = enqueue("tests.record")
+        claim(1, "dead")
+        Job.objects.filter(pk=job.pk).update(
+            locked_until=timezone.now() - timedelta(seconds=1)
+        )
+        (reclaimed,) = claim(1, "alive")
+        self.assertEqual(reclaimed.pk, job.pk)
+        self.assertEqual(reclaimed.attempts, 2)
+
+    def test_run_passes_kwargs(self):
+        enqueue("tests.record", post_id=7)
+        (job,) = claim(1, "worker")
+        run_job(job)
+        self.assertEqual(self.calls, [{"post_id": 7}])
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.DONE)
+        self.assertIsNotNone(job.finished_at)
+
+    def test_retry_backoff_then_fail(self):
+        self.failures = 3
+        enqueue("tests.record")
+        (job,) = claim(1, "worker")
+        for attempt, delay in [(1, 10), (2, 20)]:
+            before = timezone.now()
+            with self.assertLogs("jobs.queue", "ERROR"):
+                run_job(job)
+            job.refresh_from_db()
+            self.assertEqual(job.status, Job.QUEUED)
+            self.assertEqual(job.attempts, attempt)
+            self.assertIn("RuntimeError", job.last_error)
+            self.assertGreaterEqual(job.run_at, before + timedelta(seconds=delay))
+            self.assertLess(job.run_at, before + timedelta(seconds=delay + 5))
+            job = self.claim_due(job)
+
+        with self.assertLogs("jobs.queue", "ERROR"):
+            run_job(job)
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.FAILED)
+        self.assertEqual(len(self.calls), 3)
+
+    def test_unique_key_while_queued(self):
+        first = enqueue("tests.record", unique_key="render:1")
+        self.assertIsNotNone(first)
+        self.assertIsNone(enqueue("tests.record", unique_key="render:1"))
+        self.assertIsNotNone(enqueue("tests.record", unique_key="render:2"))
+
+        # 실행 중이면 새 작업을 받음 (실행 뒤 바뀐 내용을 다시 처리)
+        claim(5, "worker")
+        self.assertIsNotNone(enqueue("tests.record", unique_key="render:1"))
+
+    def test_retry_replaced_by_newer_job(self):
+        self.failures = 1
+        enqueue("tests.record", unique_key="render:1")
+        (job,) = claim(1, "worker")
+        newer = enqueue("tests.record", unique_key="render:1")
+        with self.assertLogs("jobs.queue", "ERROR"):
+            run_job(job)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.FAILED)
+        self.assertIn("새 작업으로 대체됨", job.last_error)
+        newer.refresh_from_db()
+        self.assertEqual(newer.status, Job.QUEUED)
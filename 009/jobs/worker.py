@@ -0,0 +1,69 @@
+# jobs/worker.py
+"""작업 큐 워커: 스레드 풀로 작업을 가져와 실행"""
+import logging
+import os
+import socket
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections, connection
+
+from .queue import claim, delete_finished, run_job, schedule_periodic
+
+logger = logging.getLogger(__name__)
+
+
+class Worker:
+    def __init__(self, threads=4, poll_interval=1.0):
+        self.threads = threads
+        self.poll_interval = poll_interval
+        self.name = f"{socket.gethostname()}:{os.getpid()}"
+        self.stopping = threading.Event()
+        self._housekeeping_at = 0
+
+    def stop(self):
+        """새 작업은 가져오지 않고, 실행 중인 작업이 끝나면 종료"""
+        self.stopping.set()
+
+    def run(self, once=False):
+        """once=True면 지금 실행할 수 있는 작업이 없을 때 종료"""
+        running = set()
+        with ThreadPoolExecutor(self.threads, thread_name_prefix="job") as pool:
+            while not self.stopping.is_set():
+                self._housekeeping()
+                running = {future for future in running if not future.done()}
+                free = self.threads - len(running)
+                jobs = claim(free, self.name) if free else []
+                for job in jobs:
+                    running.add(pool.submit(self._execute, job))
+                if once and not running:
+                    break
+                close_old_connections()
+                # 실행 중인 작업이 끝나 슬롯이 비거나 다음 확인 시각이 될 때까지 대기
+                if running:
+                    wait(running, timeout=self.poll_interval, return_when=FIRST_COMPLETED)
+                else:
+                    self.stopping.wait(self.poll_interval)
+        connection.close()
+
+    def _execute(self, job):
+        close_old_connections()
+        try:
+            run_job(job)
+        except Exception:
+            # 결과 기록 자체가 실패한 경우: 잠금이 만료되면 다시 실행됨
+            logger.exception("작업 결과 기록 실패: %s", job.name)
+        finally:
+            connection.close()
+
+    def _housekeeping(self):
+        """1분마다 주기 작업 등록, 오래된 완료 작업 정리"""
+        if time.monotonic() - self._housekeeping_at < 60:
+            return
+        self._housekeeping_at = time.monotonic()
+        schedule_periodic()
+        days = getattr(settings, "JOBS_KEEP_FINISHED_DAYS", 7)
+        delete_finished(timedelta(days=days))
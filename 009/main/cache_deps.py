@@ -0,0 +1,107 @@
+# main/cache_deps.py
+"""의존성 기반 캐시 무효화
+
+캐시 항목을 저장할 때 그 항목이 의존하는 대상의 이름("post:42", "tag:python",
+"posts:published" 등)과 그 시점의 버전을 함께 저장합니다.
+데이터가 바뀌면 해당 이름의 버전만 올리고(bump), 읽을 때 저장된 버전과
+현재 버전이 하나라도 다르면 무효로 봅니다. 그래서 바뀐 대상과 관련된 항목만
+다시 만들어집니다.
+
+버전 키는 캐시 항목과 다른 캐시(CACHE_DEPS_CACHE)에 두어, 캐시 항목이 많아져
+정리될 때 버전이 함께 지워지지 않게 합니다.
+"""
+import time
+from datetime import datetime, timezone
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.db import transaction
+
+KEY_PREFIX = "cache_deps:"
+
+
+def _versions_cache():
+    return caches[getattr(settings, "CACHE_DEPS_CACHE", "default")]
+
+
+def _key(name):
+    return f"{KEY_PREFIX}{name}"
+
+
+def get_versions(names):
+    """{이름: 현재 버전}"""
+    names = list(names)
+    versions_cache = _versions_cache()
+    found = versions_cache.get_many([_key(name) for name in names])
+    versions = {}
+    for name in names:
+        version = found.get(_key(name))
+        if version is None:
+            # 처음 보거나 캐시에서 밀려난 이름: 예전 버전과 겹치지 않는 값으로 시작
+            versions_cache.add(_key(name), _fresh_version(), timeout=None)
+            version = versions_cache.get(_key(name))
+        versions[name] = version
+    return versions
+
+
+def get_version(name):
+    return get_versions([name])[name]
+
+
+def bump(*names):
+    """이름들의 버전을 올려 이들에 의존하는 캐시 항목을 무효화
+
+    버전은 밀리초 단위 시각이라 마지막 변경 시각으로도 쓸 수 있습니다 (changed_at).
+    """
+    versions_cache = _versions_cache()
+    for name in set(names):
+        current = versions_cache.get(_key(name)) or 0
+        versions_cache.set(_key(name), max(_fresh_version(), current + 1), timeout=None)
+
+
+def bump_on_commit(*names):
+    """트랜잭션이 커밋된 뒤 bump (트랜잭션 밖이면 바로)
+
+    커밋 전에 올리면 다른 요청이 커밋 전 데이터를 읽어 새 버전으로 캐시할 수 있음
+    """
+    transaction.on_commit(lambda: bump(*names))
+
+
+def changed_at(versions):
+    """버전 값들 중 가장 최근 변경 시각"""
+    return datetime.fromtimestamp(max(versions) / 1000, tz=timezone.utc)
+
+
+def _fresh_version():
+    return int(time.time() * 1000)
+
+
+def depends_on(request, *names):
+    """요청 처리 중 만들어지는 캐시 항목이 names에 의존함을 기록
+
+    데이터를 읽기 전에 호출하면, 렌더링 도중 바뀐 데이터가 예전 버전으로
+    저장되는 일이 없도록 호출 시점의 버전을 기록합니다.
+    """
+    deps = getattr(request, "cache_deps", None)
+    if deps is None:
+        return
+    new_names = [name for name in names if name not in deps]
+    if new_names:
+        deps.update(get_versions(new_names))
+
+
+def cache_get(key):
+    """저장 당시 의존성 버전이 모두 그대로일 때만 값을 반환 (아니면 None)"""
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    if entry["deps"] and get_versions(entry["deps"]) != entry["deps"]:
+        return None
+    return entry["value"]
+
+
+def cache_set(key, value, deps, timeout=None):
+    """deps: 이름 목록 또는 depends_on이 기록한 {이름: 버전}"""
+    if not isinstance(deps, dict):
+        deps = get_versions(deps)
+    cache.set(key, {"value": value, "deps": dict(deps)}, timeout)
@@ -0,0 +1,91 @@
+# main/conditional.py
+"""조건부 GET (ETag / Last-Modified)
+
+뷰가 템플릿을 렌더링하기 전에 값싼 검증자만 계산해, 브라우저나 프록시가 가진
+사본이 최신이면 본문 없이 304로 응답합니다.
+
+데이터가 그대로여도 배포로 템플릿/정적 파일이 바뀌면 HTML이 달라지므로,
+검증자에는 배포 식별자(build_info)도 넣습니다.
+"""
+import functools
+import hashlib
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+
+def make_etag(parts):
+    digest = hashlib.sha1(":".join(str(part) for part in parts).encode()).hexdigest()
+    return quote_etag(digest[:20])
+
+
+@functools.lru_cache(maxsize=None)
+def build_info():
+    """(배포 식별자, 배포 시각(유닉스 초))
+
+    BUILD_ID 설정이 있으면 그 값을, 없으면 collectstatic이 만든 매니페스트의 해시를
+    씁니다. 배포 시각은 매니페스트를 쓴 시각이며, 매니페스트가 없으면(개발 환경 등)
+    ("", 0)입니다. 배포하면 프로세스가 새로 뜨므로 프로세스마다 한 번만 계산합니다.
+    """
+    storage = getattr(staticfiles_storage, "manifest_storage", None)
+    name = getattr(staticfiles_storage, "manifest_name", None)
+    try:
+        with storage.open(name) as manifest:
+            content = manifest.read()
+        built_at = storage.get_modified_time(name).timestamp()
+    except (AttributeError, TypeError, OSError):
+        content, built_at = b"", 0
+    build_id = getattr(settings, "BUILD_ID", None)
+    if build_id is None:
+        build_id = hashlib.sha1(content).hexdigest()[:12] if content else ""
+    return str(build_id), built_at
+
+
+@receiver(setting_changed)
+def clear_build_info(setting=None, **kwargs):
+    if setting in (None, "BUILD_ID", "STATIC_ROOT", "STORAGES"):
+        build_info.cache_clear()
+
+
+def set_validators(response, etag, last_modified):
+    """last_modified: 유닉스 시각(초)"""
+    response.setdefault("ETag", etag)
+    response.setdefault("Last-Modified", http_date(last_modified))
+    return response
+
+
+class ConditionalGetMixin:
+    """get_validators()가 (ETag 재료 목록, 마지막 변경 시각)을 반환하면 조건부 GET 처리
+
+    None을 반환하면 검증 없이 평소처럼 응답합니다 (없는 객체의 404 등).
+    사용자별로 본문이 달라질 수 있으므로 ETag에는 사용자 id도 넣고,
+    배포 전 사본이 304를 받지 않도록 배포 식별자와 배포 시각도 반영합니다.
+    """
+
+    def get_validators(self):
+        return None
+
+    def not_modified(self):
+        """304로 응답할 때 호출 (렌더링 없이도 해야 하는 일)"""
+
+    def get(self, request, *args, **kwargs):
+        validators = self.get_validators()
+        if validators is None:
+            return super().get(request, *args, **kwargs)
+
+        parts, last_modified = validators
+        build_id, built_at = build_info()
+        etag = make_etag([*parts, request.user.pk, build_id])
+        timestamp = int(max(last_modified.timestamp(), built_at))
+        response = get_conditional_response(
+            request, etag=etag, last_modified=timestamp
+        )
+        if response is not None:
+            self.not_modified()
+        else:
+            response = super().get(request, *args, **kwargs)
+        return set_validators(response, etag, timestamp)
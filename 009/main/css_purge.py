@@ -0,0 +1,192 @@
+# main/css_purge.py
+"""사용하지 않는 CSS 규칙 제거 (collectstatic에서 실행, main.static_files 참고)
+
+템플릿, 폼 위젯 attrs(blog/forms.py, accounts/forms.py), JS 파일에 나오는 단어를
+모두 "사용 중인 이름"으로 보고, 선택자의 클래스/ID/태그 이름이 모두 그 안에 있는
+규칙만 남깁니다. (문자열을 조립해 만드는 클래스는 CSS_PURGE_SAFELIST에 추가)
+
+critical CSS는 템플릿의 {# critical-css #} ~ {# /critical-css #} 구간(base.html의
+내비게이션과 마스트헤드, 마스트헤드를 바꾸는 자식 템플릿의 header 블록)에 나오는
+이름만으로 같은 방식으로 줄인 것으로, <head>에 바로 넣습니다.
+"""
+import glob
+import os
+import re
+from fnmatch import fnmatch
+
+from django.conf import settings
+
+CRITICAL_START = "{# critical-css #}"
+CRITICAL_END = "{# /critical-css #}"
+
+# 어떤 페이지에나 있는 태그
+ALWAYS_USED = {"html", "body"}
+
+# 괄호 안 선택자는 조건이므로 사용 여부 판단에서 뺌 (:not(.btn-check) 등)
+FUNCTIONAL_PSEUDO_RE = re.compile(r":(?:not|is|where|has)\(")
+STRING_RE = re.compile(r"(\"(?:\\.|[^\"\\])*\"|'(?:\\.|[^'\\])*')")
+TOKEN_RE = re.compile(r"[A-Za-z0-9_-]+")
+LICENSE_RE = re.compile(r"/\*!.*?\*/", re.S)
+COMMENT_RE = re.compile(STRING_RE.pattern + r"|/\*.*?\*/", re.S)
+CRITICAL_RE = re.compile(
+    re.escape(CRITICAL_START) + "(.*?)" + re.escape(CRITICAL_END), re.S
+)
+URL_RE = re.compile(r"url\(\s*(['\"]?)(?!data:|https?:|/|#)([^'\")]+)\1\s*\)")
+
+
+def tokens(text):
+    return set(TOKEN_RE.findall(text))
+
+
+def content_tokens():
+    """CSS_PURGE_CONTENT 파일들에 나오는 단어 + CSS_PURGE_SAFELIST"""
+    used = set(ALWAYS_USED)
+    for pattern in getattr(settings, "CSS_PURGE_CONTENT", []):
+        for path in glob.glob(os.path.join(settings.BASE_DIR, pattern), recursive=True):
+            with open(path, encoding="utf-8") as file:
+                used |= tokens(file.read())
+    return used
+
+
+def critical_tokens():
+    """CSS_CRITICAL_TEMPLATES 파일들의 critical-css 구간에 나오는 단어"""
+    used = set(ALWAYS_USED)
+    for pattern in getattr(settings, "CSS_CRITICAL_TEMPLATES", []):
+        for path in glob.glob(os.path.join(settings.BASE_DIR, pattern), recursive=True):
+            with open(path, encoding="utf-8") as file:
+                text = file.read()
+            for match in CRITICAL_RE.finditer(text):
+                used |= tokens(match.group(1))
+    return used
+
+
+def purge(css, used, safelist=None):
+    """used에 없는 이름을 쓰는 선택자를 지우고 공백을 줄인 CSS"""
+    safelist = (
+        safelist
+        if safelist is not None
+        else getattr(settings, "CSS_PURGE_SAFELIST", [])
+    )
+
+    def is_used(name):
+        return name in used or any(fnmatch(name, pattern) for pattern in safelist)
+
+    rules = "".join(_purge_rules(_strip_comments(css), is_used))
+    # /*! 라이선스 주석은 유지 (@charset은 맨 앞이어야 하므로 그 뒤에)
+    licenses = "".join(LICENSE_RE.findall(css))
+    if rules.startswith("@charset"):
+        charset, _, rules = rules.partition(";")
+        return f"{charset};{licenses}{rules}"
+    return licenses + rules
+
+
+def absolutize_urls(css, base_url):
+    """<style>로 넣을 CSS의 상대 url()을 원래 CSS 파일 위치 기준 절대 경로로"""
+
+    def replace(match):
+        quote, path = match.groups()
+        return f"url({quote}{os.path.normpath(base_url + path)}{quote})"
+
+    return URL_RE.sub(replace, css)
+
+
+def _purge_rules(css, is_used):
+    for prelude, body in _split_rules(css):
+        if body is None:
+            # @charset, @import
+            yield prelude + ";"
+        elif prelude.startswith("@"):
+            name = prelude[1:].split(None, 1)[0].lower()
+            if name in ("media", "supports", "container", "layer"):
+                inner = "".join(_purge_rules(body, is_used))
+                if inner:
+                    yield f"{_minify(prelude)}{{{inner}}}"
+            else:
+                # @keyframes, @font-face 등은 그대로
+                yield f"{_minify(prelude)}{{{_minify(body)}}}"
+        else:
+            selectors = [
+                selector
+                for selector in _split_top_level(prelude, ",")
+                if _selector_used(selector, is_used)
+            ]
+            if selectors:
+                yield f"{','.join(selectors)}{{{_minify(body)}}}"
+
+
+def _split_rules(css):
+    """최상위 (prelude, body) 목록, body가 없는 at-rule은 body=None"""
+    position, depth, start = 0, 0, 0
+    prelude = None
+    for match in re.finditer(r"[{};]|\"(?:\\.|[^\"\\])*\"|'(?:\\.|[^'\\])*'", css):
+        char = match.group()
+        if char == "{":
+            if depth == 0:
+                prelude = css[start : match.start()].strip()
+                position = match.end()
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                yield prelude, css[position : match.start()]
+                start = match.end()
+        elif char == ";" and depth == 0:
+            statement = css[start : match.start()].strip()
+            if statement:
+                yield statement, None
+            start = match.end()
+
+
+def _split_top_level(text, separator):
+    parts, depth, current = [], 0, []
+    for piece in STRING_RE.split(text):
+        if STRING_RE.fullmatch(piece):
+            current.append(piece)
+            continue
+        for char in piece:
+            if char in "([":
+                depth += 1
+            elif char in ")]":
+                depth -= 1
+            if char == separator and depth == 0:
+                parts.append("".join(current).strip())
+                current = []
+            else:
+                current.append(char)
+    parts.append("".join(current).strip())
+    return [part for part in parts if part]
+
+
+def _selector_used(selector, is_used):
+    selector = _remove_functional_pseudos(selector)
+    selector = re.sub(r"\[[^\]]*\]", "", selector)  # 속성 선택자
+    selector = re.sub(r"::?[\w-]+", "", selector)  # :hover, ::before
+    names = re.findall(r"[.#](-?[_a-zA-Z][\w-]*)", selector)
+    names += re.findall(r"(?:^|[\s>+~])([a-zA-Z][\w-]*)", selector)
+    return all(is_used(name) for name in names)
+
+
+def _remove_functional_pseudos(selector):
+    while True:
+        match = FUNCTIONAL_PSEUDO_RE.search(selector)
+        if not match:
+            return selector
+        depth, end = 1, match.end()
+        while end < len(selector) and depth:
+            depth += {"(": 1, ")": -1}.get(selector[end], 0)
+            end += 1
+        selector = selector[: match.start()] + selector[end:]
+
+
+def _strip_comments(css):
+    # 문자열 안의 /* */는 그대로 두도록 문자열과 주석을 함께 찾음
+    return COMMENT_RE.sub(lambda match: match.group(1) or "", css)
+
+
+def _minify(text):
+    """문자열 밖의 공백을 줄임"""
+    parts = STRING_RE.split(text.strip())
+    for index in range(0, len(parts), 2):
+        part = re.sub(r"\s+", " ", parts[index])
+        parts[index] = re.sub(r"\s*([;:{},>])\s*", r"\1", part)
+    return "".join(parts).rstrip(";")
@@ -0,0 +1,17 @@
+# main/fragments.py
+"""캐시된 페이지의 사용자별 영역(hole) 등록부
+
+각 hole은 템플릿 하나와, /fragments/ 요청 파라미터로 그 템플릿의 컨텍스트를
+만드는 함수로 이루어집니다. 페이지를 렌더링할 때는 {% hole %} 태그가 같은
+템플릿을 현재 컨텍스트로 바로 그리고, 캐시된 페이지에서는 자바스크립트가
+/fragments/에서 로그인 사용자 기준 HTML을 받아 바꿔 끼웁니다.
+"""
+HOLES = {}
+
+
+def register_hole(name, template_name, get_context=None):
+    """get_context(request, params) -> dict (params는 {% hole %}에 넘긴 값)"""
+    HOLES[name] = (template_name, get_context)
+
+
+register_hole("nav_user", "main/fragments/nav_user.html")
@@ -0,0 +1,271 @@
+# main/imaging.py
+"""업로드 이미지의 반응형 파생 이미지(variants)
+
+원본은 그대로 두고, 작업 큐에서 고정 너비별 WebP/JPEG 사본과 아주 작은
+미리보기(placeholder, data URI)를 만듭니다. 사본은 메타데이터(EXIF 등) 없이
+저장되며, 이름이 원본 이름에서 정해지므로 템플릿은 파일을 열지 않고
+DB 값(너비, placeholder)만으로 srcset을 만들 수 있습니다.
+
+    variants/post_images/photo/480.webp
+    variants/post_images/photo/480.jpg
+    ...
+"""
+import base64
+import os
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import models, transaction
+from django.db.models import signals
+from PIL import ExifTags, Image, ImageOps
+
+DEFAULT_PRESETS = {
+    "thumbnail": [480, 960, 1600],
+    "avatar": [64, 128, 256],
+}
+
+# 확장자: (Pillow 포맷, MIME 타입, 저장 옵션), 작은 순서
+# (collectstatic의 정적 배경 이미지 사본도 같은 표를 씀, main.static_files)
+IMAGE_FORMATS = {
+    "avif": ("AVIF", "image/avif", {"quality": 55}),
+    "webp": ("WEBP", "image/webp", {"quality": 80, "method": 4}),
+    "jpg": (
+        "JPEG",
+        "image/jpeg",
+        {"quality": 82, "optimize": True, "progressive": True},
+    ),
+}
+
+# 업로드 파생 이미지 형식 (AVIF는 인코딩이 느려 작업 큐에서는 만들지 않음)
+FORMATS = {ext: IMAGE_FORMATS[ext] for ext in ("webp", "jpg")}
+
+PLACEHOLDER_WIDTH = 16
+
+
+def preset_widths(preset):
+    presets = getattr(settings, "IMAGE_VARIANT_PRESETS", DEFAULT_PRESETS)
+    return presets[preset]
+
+
+def variant_widths(preset, original_width):
+    """원본보다 크게 늘리지 않도록 원본 너비로 제한한 너비 목록"""
+    if not original_width:
+        return []
+    return sorted({min(width, original_width) for width in preset_widths(preset)})
+
+
+def variant_name(name, width, ext):
+    stem = os.path.splitext(name)[0]
+    return f"variants/{stem}/{width}.{ext}"
+
+
+def variant_url(name, width, ext):
+    return default_storage.url(variant_name(name, width, ext))
+
+
+def generate_variants(fieldfile, preset):
+    """프리셋 너비별 WebP/JPEG 사본을 저장
+
+    (회전을 반영한 원본 크기, placeholder data URI)를 반환합니다.
+    """
+    with fieldfile.open("rb") as file:
+        image, size = load_image(file, max(preset_widths(preset)))
+    for width in variant_widths(preset, size[0]):
+        resized = resize(image, width)
+        for ext in FORMATS:
+            _save(resized, variant_name(fieldfile.name, width, ext), ext)
+    return size, _placeholder(image)
+
+
+def load_image(file, max_width):
+    """(EXIF 방향을 반영해 RGB/RGBA로 바꾼 이미지, 회전을 반영한 원본 크기)
+
+    JPEG는 max_width 이상으로만 축소해서 디코딩합니다 (큰 사진에서 빠름).
+    """
+    with Image.open(file) as source:
+        size = _oriented_size(source)
+        source.draft("RGB", (max_width, max_width))
+        image = ImageOps.exif_transpose(source)
+        has_alpha = image.mode in ("RGBA", "LA") or (
+            image.mode == "P" and "transparency" in image.info
+        )
+        return image.convert("RGBA" if has_alpha else "RGB"), size
+
+
+def _oriented_size(image):
+    """EXIF 방향(90도 회전)을 반영한 크기"""
+    width, height = image.size
+    if image.getexif().get(ExifTags.Base.Orientation) in (5, 6, 7, 8):
+        return height, width
+    return width, height
+
+
+def resize(image, width):
+    """너비 width로 축소 (원본보다 크게 늘리지 않음)"""
+    if width >= image.width:
+        return image
+    height = max(1, round(image.height * width / image.width))
+    return image.resize((width, height), Image.Resampling.LANCZOS)
+
+
+def encode(image, ext):
+    """메타데이터 없이 인코딩 (Pillow는 exif를 넘기지 않으면 저장하지 않음)"""
+    pillow_format, _, options = IMAGE_FORMATS[ext]
+    if pillow_format == "JPEG" and image.mode == "RGBA":
+        # JPEG는 투명도가 없으므로 흰 배경에 합성
+        background = Image.new("RGB", image.size, "white")
+        background.paste(image, mask=image.getchannel("A"))
+        image = background
+    buffer = BytesIO()
+    image.save(buffer, pillow_format, **options)
+    return buffer.getvalue()
+
+
+def _save(image, name, ext):
+    # 같은 이름으로 덮어쓰도록 먼저 지움 (storage.save는 이름이 겹치면 바꿈)
+    default_storage.delete(name)
+    default_storage.save(name, ContentFile(encode(image, ext)))
+
+
+def _placeholder(image):
+    tiny = resize(image, PLACEHOLDER_WIDTH)
+    if tiny.mode == "RGBA":
+        tiny = tiny.convert("RGB")
+    buffer = BytesIO()
+    tiny.save(buffer, "JPEG", quality=40)
+    return "data:image/jpeg;base64," + base64.b64encode(buffer.getvalue()).decode()
+
+
+class ResponsiveImageField(models.ImageField):
+    """업로드되면 작업 큐에서 파생 이미지를 만드는 ImageField
+
+    - preset: 만들 너비 목록 이름 (IMAGE_VARIANT_PRESETS)
+    - placeholder_field: 파생 이미지가 준비되면 미리보기 data URI가 저장되는 필드
+      (비어 있으면 아직 준비 전이므로 원본을 씀)
+    - width_field/height_field는 업로드할 때만 계산하고, DB에서 불러올 때는
+      파일을 열지 않습니다.
+    - 이미지가 바뀌거나 행이 삭제되면 이전 원본을 저장소에서 해제합니다.
+    """
+
+    def __init__(self, *args, preset=None, placeholder_field=None, **kwargs):
+        self.preset = preset
+        self.placeholder_field = placeholder_field
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        kwargs["preset"] = self.preset
+        if self.placeholder_field:
+            kwargs["placeholder_field"] = self.placeholder_field
+        return name, path, args, kwargs
+
+    def contribute_to_class(self, cls, name, **kwargs):
+        super().contribute_to_class(cls, name, **kwargs)
+        if not cls._meta.abstract:
+            signals.post_init.connect(self._remember_name, sender=cls)
+            signals.post_save.connect(self._image_saved, sender=cls)
+            signals.post_delete.connect(self._row_deleted, sender=cls)
+
+    def update_dimension_fields(self, instance, force=False, *args, **kwargs):
+        # 불러올 때(post_init)는 건너뛰고, 새 파일이 지정될 때(force)만 계산
+        if force:
+            super().update_dimension_fields(instance, force=True, *args, **kwargs)
+
+    def widths(self, instance):
+        width = getattr(instance, self.width_field) if self.width_field else None
+        return variant_widths(self.preset, width)
+
+    def is_ready(self, instance):
+        """파생 이미지가 만들어졌는지 여부"""
+        return bool(self.placeholder_field and getattr(instance, self.placeholder_field))
+
+    def pre_save(self, model_instance, add):
+        file = getattr(model_instance, self.attname)
+        uploading = bool(file) and not file._committed
+        file = super().pre_save(model_instance, add)
+        # 같은 내용을 다시 올리면 이름(내용 해시)이 그대로라 _image_saved가 이전 원본을
+        # 해제하지 않으므로, 업로드하며 늘어난 참조를 여기서 되돌림
+        if uploading and file.name == model_instance.__dict__.get(
+            f"_initial_{self.attname}"
+        ):
+            self._release(file.name)
+        return file
+
+    def _remember_name(self, instance, **kwargs):
+        instance.__dict__[f"_initial_{self.attname}"] = str(
+            instance.__dict__.get(self.attname) or ""
+        )
+
+    def _image_saved(self, sender, instance, update_fields=None, **kwargs):
+        if self.attname not in instance.__dict__ or (
+            update_fields is not None and self.name not in update_fields
+        ):
+            return
+        name = getattr(instance, self.attname).name or ""
+        key = f"_initial_{self.attname}"
+        previous = instance.__dict__.get(key)
+        if name == previous:
+            return
+        instance.__dict__[key] = name
+        if previous:
+            self._release(previous)
+
+        if self.placeholder_field and getattr(instance, self.placeholder_field):
+            # 새 이미지의 파생 이미지가 준비될 때까지 원본 사용
+            setattr(instance, self.placeholder_field, "")
+            sender._default_manager.filter(pk=instance.pk).update(
+                **{self.placeholder_field: ""}
+            )
+        if name:
+            from jobs.queue import enqueue
+
+            label = sender._meta.label
+            enqueue(
+                "main.make_image_variants",
+                model=label,
+                pk=instance.pk,
+                field=self.name,
+                unique_key=f"image_variants:{label}:{instance.pk}:{self.name}",
+            )
+
+    def _row_deleted(self, instance, **kwargs):
+        name = instance.__dict__.get(f"_initial_{self.attname}")
+        if name:
+            self._release(name)
+
+    def _release(self, name):
+        """더 이상 쓰지 않는 원본 파일 해제 (커밋된 뒤, 공유 저장소면 참조 수만 줄임)"""
+        transaction.on_commit(lambda: self.storage.delete(name))
+
+    def make_variants(self, instance):
+        """파생 이미지를 만들고 placeholder와 크기를 저장"""
+        fieldfile = getattr(instance, self.attname)
+        if not fieldfile:
+            return
+        size, placeholder = generate_variants(fieldfile, self.preset)
+        # 크기 필드도 회전을 반영한 크기로 저장 (srcset 너비가 이 값으로 정해짐)
+        update_fields = [self.placeholder_field]
+        for name, value in zip((self.width_field, self.height_field), size):
+            if name:
+                setattr(instance, name, value)
+                update_fields.append(name)
+
+        # 그 사이 다른 이미지로 바뀌었으면 저장하지 않음 (새 작업이 처리)
+        current = type(instance)._default_manager.filter(
+            pk=instance.pk, **{self.attname: fieldfile.name}
+        )
+        if current.exists():
+            setattr(instance, self.placeholder_field, placeholder)
+            instance.save(update_fields=update_fields)
+
+
+def responsive_image_fields():
+    """(모델, 필드) 목록"""
+    from django.apps import apps
+
+    for model in apps.get_models():
+        for field in model._meta.get_fields():
+            if isinstance(field, ResponsiveImageField):
+                yield model, field
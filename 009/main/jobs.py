@@ -0,0 +1,30 @@
+# main/jobs.py
+from io import StringIO
+
+from django.apps import apps
+from django.core.management import call_command
+from django.db import connection
+
+from jobs.queue import task
+
+
+@task("main.sqlite_maintenance", every=3600)
+def sqlite_maintenance():
+    """PRAGMA optimize와 WAL 체크포인트 (1시간마다)"""
+    if connection.vendor == "sqlite":
+        call_command("sqlite_maintenance", stdout=StringIO())
+
+
+@task("main.make_image_variants", priority=5)
+def make_image_variants(model, pk, field):
+    """업로드된 이미지의 반응형 파생 이미지 생성 (main.imaging)"""
+    model_class = apps.get_model(model)
+    instance = model_class._default_manager.filter(pk=pk).first()
+    if instance is not None:
+        model_class._meta.get_field(field).make_variants(instance)
+
+
+@task("main.collect_media_garbage", every=3600, timeout=1800)
+def collect_media_garbage():
+    """참조가 끊긴 업로드 파일 정리 (1시간마다 MEDIA_GC_MAX_FILES개씩 이어서)"""
+    call_command("collect_media_garbage", stdout=StringIO())
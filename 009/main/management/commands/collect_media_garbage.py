@@ -0,0 +1,73 @@
+# main/management/commands/collect_media_garbage.py
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from main.media_gc import MediaCollector
+
+
+class Command(BaseCommand):
+    help = (
+        "참조가 끊긴 업로드 파일을 휴지통(MEDIA_ROOT/.trash)으로 옮기고, "
+        "보관 기간이 지난 휴지통을 비웁니다. (체크포인트부터 이어서 실행)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--grace-hours",
+            type=float,
+            default=getattr(settings, "MEDIA_GC_GRACE_HOURS", 24),
+            help="이 시간보다 최근에 수정된 파일은 건너뜀",
+        )
+        parser.add_argument(
+            "--trash-days",
+            type=int,
+            default=getattr(settings, "MEDIA_GC_TRASH_DAYS", 7),
+            help="휴지통 보관 기간(일)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=getattr(settings, "MEDIA_GC_BATCH_SIZE", 200),
+            help="이만큼 확인할 때마다 체크포인트를 남기고 쉼",
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=getattr(settings, "MEDIA_GC_BATCH_SLEEP", 0.2),
+            help="묶음 사이에 쉬는 시간(초)",
+        )
+        parser.add_argument(
+            "--max-files",
+            type=int,
+            default=getattr(settings, "MEDIA_GC_MAX_FILES", 5000),
+            help="한 번 실행에서 확인할 최대 파일 수 (0이면 끝까지)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="옮기거나 지우지 않고 대상만 출력",
+        )
+
+    def handle(self, *args, **options):
+        verbose = options["verbosity"] > 1 or options["dry_run"]
+        collector = MediaCollector(
+            grace=timedelta(hours=options["grace_hours"]),
+            trash_days=options["trash_days"],
+            batch_size=options["batch_size"],
+            batch_sleep=options["sleep"],
+            max_files=options["max_files"] or None,
+            dry_run=options["dry_run"],
+            log=self.stdout.write if verbose else None,
+        )
+        result = collector.run()
+        message = (
+            f"{result.scanned}개 확인, {result.trashed}개"
+            f"({result.trashed_bytes / 1024:.1f}KB) 휴지통으로 이동"
+        )
+        if result.purged_days:
+            message += f", 휴지통 비움: {', '.join(result.purged_days)}"
+        if not result.finished:
+            message += " (다음 실행에서 이어서 진행)"
+        self.stdout.write(message)
@@ -0,0 +1,37 @@
+# main/management/commands/make_image_variants.py
+from django.core.management.base import BaseCommand
+
+from main.imaging import responsive_image_fields
+
+
+class Command(BaseCommand):
+    help = "업로드 이미지의 반응형 파생 이미지(WebP/JPEG)를 만듭니다. (기존 이미지 백필용)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="이미 만들어진 이미지도 다시 생성 (프리셋 너비를 바꾼 경우)",
+        )
+
+    def handle(self, *args, **options):
+        for model, field in responsive_image_fields():
+            queryset = model._default_manager.exclude(
+                **{f"{field.attname}__isnull": True}
+            ).exclude(**{field.attname: ""})
+            if not options["all"]:
+                queryset = queryset.filter(**{field.placeholder_field: ""})
+
+            done = failed = 0
+            for instance in queryset.iterator():
+                try:
+                    field.make_variants(instance)
+                except Exception as exc:
+                    failed += 1
+                    self.stderr.write(f"{model._meta.label} #{instance.pk}: {exc}")
+                else:
+                    done += 1
+            self.stdout.write(
+                f"{model._meta.label}.{field.name}: {done}개 생성"
+                + (f", {failed}개 실패" if failed else "")
+            )
@@ -0,0 +1,44 @@
+# main/management/commands/sqlite_maintenance.py
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+
+class Command(BaseCommand):
+    help = "SQLite DB에 PRAGMA optimize와 WAL 체크포인트를 실행합니다. (cron 또는 --loop)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--database", default="default", help="대상 DB 별칭")
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="종료하지 않고 --interval 초마다 반복 실행",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=3600,
+            help="--loop 실행 시 실행 간격(초)",
+        )
+
+    def handle(self, *args, **options):
+        connection = connections[options["database"]]
+        if connection.vendor != "sqlite":
+            raise CommandError("SQLite DB에서만 사용할 수 있습니다.")
+
+        while True:
+            with connection.cursor() as cursor:
+                cursor.execute("PRAGMA optimize")
+                # WAL 내용을 DB 파일에 반영하고 WAL 파일을 비움
+                # (읽는 중인 연결이 있으면 busy=1로 일부만 반영)
+                cursor.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                busy, wal_pages, checkpointed = cursor.fetchone()
+            self.stdout.write(
+                f"optimize 완료, 체크포인트 {checkpointed}/{wal_pages} 페이지"
+                + (" (사용 중인 연결이 있어 일부만 반영)" if busy else "")
+            )
+            if not options["loop"]:
+                break
+            connection.close()
+            time.sleep(options["interval"])
@@ -0,0 +1,237 @@
+# main/media_gc.py
+"""참조가 끊긴 업로드 파일 정리 (manage.py collect_media_garbage)
+
+게시글 삭제나 이미지 교체 때 이전 파일 해제가 실패했거나, 업로드 뒤 모델 저장이
+실패했거나, 파일 해제 기능 이전에 교체된 파일은 MEDIA_ROOT에 계속 남습니다.
+정리는 다음 순서로 진행합니다.
+
+1. DB의 모든 파일 필드 값을 조금씩(iterator) 읽어 참조 중인 경로 집합을 만듦
+2. MEDIA_ROOT를 정렬된 순서로 훑으며 참조되지 않고 유예 시간이 지난 파일을
+   휴지통(.trash/<날짜>/)으로 옮김
+3. 보관 기간이 지난 휴지통 날짜 디렉터리를 삭제
+
+한 번에 max_files개까지만 보고 마지막 경로를 체크포인트로 남기므로, 다음 실행은
+이어서 진행합니다. 묶음(batch_size)마다 쉬어 운영 중인 서버의 디스크 I/O를
+독차지하지 않습니다.
+"""
+import os
+import shutil
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage
+from django.db import models, transaction
+
+from .imaging import ResponsiveImageField, variant_name
+from .models import StoredFile
+from .storage import INCOMING_DIR
+
+TRASH_DIR = ".trash"
+CHECKPOINT_FILE = "checkpoint"
+VARIANTS_DIR = "variants"
+
+
+@dataclass
+class Result:
+    scanned: int = 0
+    trashed: int = 0
+    trashed_bytes: int = 0
+    purged_days: list = field(default_factory=list)
+    finished: bool = False  # 끝까지 훑었으면 True (다음 실행은 처음부터)
+
+
+class MediaCollector:
+    def __init__(
+        self,
+        grace=timedelta(hours=24),
+        trash_days=7,
+        batch_size=200,
+        batch_sleep=0.2,
+        max_files=None,
+        dry_run=False,
+        log=None,
+    ):
+        self.root = os.path.abspath(settings.MEDIA_ROOT)
+        self.grace = grace
+        self.trash_days = trash_days
+        self.batch_size = batch_size
+        self.batch_sleep = batch_sleep
+        self.max_files = max_files
+        self.dry_run = dry_run
+        self.log = log or (lambda message: None)
+        self.trash_root = os.path.join(self.root, TRASH_DIR)
+        self.checkpoint_path = os.path.join(self.trash_root, CHECKPOINT_FILE)
+
+    # 참조 집합
+
+    def file_fields(self):
+        """MEDIA_ROOT에 저장하는 (모델, 파일 필드) 목록"""
+        for model in apps.get_models():
+            for model_field in model._meta.concrete_fields:
+                if not isinstance(model_field, models.FileField):
+                    continue
+                storage = model_field.storage
+                if (
+                    isinstance(storage, FileSystemStorage)
+                    and os.path.abspath(storage.location) == self.root
+                ):
+                    yield model, model_field
+
+    def referenced(self):
+        """참조 중인 경로별 참조 수 (파생 이미지는 원본 이름에서 계산)"""
+        counts = Counter()
+        variant_dirs = set()
+        for model, model_field in self.file_fields():
+            names = (
+                model._default_manager.exclude(**{model_field.attname: ""})
+                .exclude(**{f"{model_field.attname}__isnull": True})
+                .values_list(model_field.attname, flat=True)
+            )
+            for name in names.iterator(chunk_size=2000):
+                counts[name] += 1
+                if isinstance(model_field, ResponsiveImageField):
+                    variant_dirs.add(os.path.dirname(variant_name(name, 0, "")))
+        return counts, variant_dirs
+
+    def is_referenced_now(self, name):
+        """옮기기 직전 다시 확인 (참조 집합을 만든 뒤 새로 올라온 같은 파일)"""
+        return any(
+            model._default_manager.filter(**{model_field.attname: name}).exists()
+            for model, model_field in self.file_fields()
+        )
+
+    # 훑기
+
+    def walk(self, start_after=(), directory=()):
+        """(경로 조각 튜플, DirEntry)를 이름순으로 (start_after 다음부터)"""
+        try:
+            entries = sorted(
+                os.scandir(os.path.join(self.root, *directory)),
+                key=lambda entry: entry.name,
+            )
+        except FileNotFoundError:
+            return
+        for entry in entries:
+            parts = (*directory, entry.name)
+            if parts == (TRASH_DIR,):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                # 체크포인트보다 앞선 디렉터리는 통째로 건너뜀
+                if parts >= start_after[: len(parts)]:
+                    yield from self.walk(start_after, parts)
+            elif entry.is_file(follow_symlinks=False) and parts > start_after:
+                yield parts, entry
+
+    def is_orphan(self, path, counts, variant_dirs):
+        if path in counts:
+            return False
+        if path.startswith(VARIANTS_DIR + "/"):
+            return os.path.dirname(path) not in variant_dirs
+        return True
+
+    def run(self):
+        result = Result()
+        counts, variant_dirs = self.referenced()
+        cutoff = time.time() - self.grace.total_seconds()
+        last = self._read_checkpoint()
+        if last:
+            self.log(f"{last} 다음부터 이어서 확인")
+
+        for parts, entry in self.walk(tuple(last.split("/")) if last else ()):
+            if self.max_files and result.scanned >= self.max_files:
+                break
+            result.scanned += 1
+            path = last = "/".join(parts)
+            stat = entry.stat(follow_symlinks=False)
+            if stat.st_mtime < cutoff and self.is_orphan(path, counts, variant_dirs):
+                if self._trash(path):
+                    result.trashed += 1
+                    result.trashed_bytes += stat.st_size
+            if result.scanned % self.batch_size == 0:
+                self._write_checkpoint(last)
+                time.sleep(self.batch_sleep)
+        else:
+            result.finished = True
+            self._reconcile(counts)
+
+        self._write_checkpoint("" if result.finished else last)
+        result.purged_days = self.purge_trash()
+        return result
+
+    # 휴지통
+
+    def _trash(self, path):
+        """참조가 없으면 휴지통으로 옮기고 True"""
+        self.log(f"휴지통으로 이동: {path}")
+        if self.dry_run:
+            return True
+        # 저장소의 _save/delete와 같은 쓰기 잠금 안에서 다시 확인하고 옮김
+        with transaction.atomic():
+            if not path.startswith((VARIANTS_DIR + "/", INCOMING_DIR + "/")):
+                if self.is_referenced_now(path):
+                    return False
+                StoredFile.objects.select_for_update().filter(name=path).delete()
+            target = os.path.join(self.trash_root, date.today().isoformat(), path)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            try:
+                os.replace(os.path.join(self.root, path), target)
+            except FileNotFoundError:
+                return False
+        self._remove_empty_parents(path)
+        return True
+
+    def _remove_empty_parents(self, path):
+        directory = os.path.dirname(path)
+        while directory:
+            try:
+                os.rmdir(os.path.join(self.root, directory))
+            except OSError:
+                break
+            directory = os.path.dirname(directory)
+
+    def purge_trash(self):
+        """보관 기간이 지난 휴지통 날짜 디렉터리 삭제"""
+        oldest = (date.today() - timedelta(days=self.trash_days)).isoformat()
+        purged = []
+        if not os.path.isdir(self.trash_root):
+            return purged
+        for entry in sorted(os.scandir(self.trash_root), key=lambda entry: entry.name):
+            if entry.is_dir() and entry.name < oldest:
+                self.log(f"휴지통 비움: {entry.name}")
+                if not self.dry_run:
+                    shutil.rmtree(entry.path)
+                    time.sleep(self.batch_sleep)
+                purged.append(entry.name)
+        return purged
+
+    def _reconcile(self, counts):
+        """끝까지 훑은 뒤 StoredFile 참조 수를 실제 참조 수에 맞춤
+
+        (업로드는 됐지만 모델 저장이 실패한 경우 등으로 어긋난 값)
+        """
+        if self.dry_run:
+            return
+        for stored in StoredFile.objects.iterator():
+            actual = counts.get(stored.name, 0)
+            if actual and actual != stored.ref_count:
+                StoredFile.objects.filter(pk=stored.pk).update(ref_count=actual)
+
+    # 체크포인트
+
+    def _read_checkpoint(self):
+        try:
+            with open(self.checkpoint_path, encoding="utf-8") as file:
+                return file.read().strip()
+        except FileNotFoundError:
+            return ""
+
+    def _write_checkpoint(self, path):
+        if self.dry_run:
+            return
+        os.makedirs(self.trash_root, exist_ok=True)
+        with open(self.checkpoint_path, "w", encoding="utf-8") as file:
+            file.write(path)
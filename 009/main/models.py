@@ -1,3 +1,21 @@
 from django.db import models
 
-# Create your models here.
+
+class StoredFile(models.Model):
+    """내용 주소 저장소(main.storage)의 파일별 참조 수
+
+    같은 내용의 파일은 한 번만 저장되고, 업로드될 때마다 ref_count가 늘어납니다.
+    참조가 모두 해제되면(0) 파일을 지웁니다.
+    """
+
+    name = models.CharField(max_length=255, unique=True, verbose_name="파일 경로")
+    size = models.PositiveBigIntegerField(default=0, verbose_name="크기(바이트)")
+    ref_count = models.PositiveIntegerField(default=0, verbose_name="참조 수")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일")
+
+    class Meta:
+        verbose_name = "저장 파일"
+        verbose_name_plural = "저장 파일 목록"
+
+    def __str__(self):
+        return f"{self.name} ({self.ref_count})"
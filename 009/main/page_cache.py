@@ -0,0 +1,142 @@
+# main/page_cache.py
+"""익명 기준 전체 페이지 캐시
+
+캐시할 페이지는 항상 익명 사용자 기준으로 렌더링해 저장하고,
+로그인 상태에 따라 달라지는 부분(네비게이션 로그인 메뉴, 수정 버튼 등)은
+{% hole %} 태그로 감싼 뒤 /fragments/ 엔드포인트에서 사용자별로 채웁니다.
+그래서 로그인 사용자도 같은 캐시 본문을 함께 씁니다.
+
+뷰는 렌더링하면서 depends_on(request, ...)으로 의존 대상을 기록하고,
+페이지는 그 대상의 버전이 바뀔 때만 무효화됩니다 (main.cache_deps 참고).
+"""
+import hashlib
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import parse_http_date_safe
+
+from .cache_deps import cache_get, cache_set
+from .conditional import build_info
+
+
+def page_cache_key(request):
+    """호스트, 경로와 캐시하는 뷰가 읽는 쿼리 파라미터(PAGE_CACHE_QUERY_PARAMS)로 만든 키
+
+    그 밖의 파라미터(utm_* 등)는 본문에 영향이 없으므로 키에서 빼서, 임의의 쿼리
+    문자열이 캐시 항목을 늘리지 못하게 합니다. 배포 전에 렌더링한 본문을 쓰지 않도록
+    배포 식별자도 넣습니다.
+    """
+    params = [
+        (name, value)
+        for name in sorted(getattr(settings, "PAGE_CACHE_QUERY_PARAMS", ()))
+        for value in request.GET.getlist(name)
+    ]
+    url = f"{request.get_host()}{request.path}?{urlencode(params)}"
+    digest = hashlib.sha256(f"{build_info()[0]}:{url}".encode()).hexdigest()
+    return f"page_cache:{digest}"
+
+
+class PageCacheMiddleware:
+    """PAGE_CACHE_VIEWS에 등록된 뷰의 GET 응답을 캐시
+
+    캐시 적중 시 뷰를 실행하지 않으므로, 조회수처럼 요청마다 해야 하는 일은
+    뷰 클래스의 page_cache_hit(request, **kwargs)에서 처리합니다.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        key = getattr(request, "page_cache_key", None)
+        if (
+            key
+            and response.status_code == 200
+            and not response.streaming
+            and not response.cookies
+        ):
+            cache_set(
+                key,
+                {
+                    "content": response.content,
+                    "content_type": response["Content-Type"],
+                    "etag": response.get("ETag"),
+                    "last_modified": response.get("Last-Modified"),
+                },
+                request.cache_deps,
+                getattr(settings, "PAGE_CACHE_TIMEOUT", 300),
+            )
+            response["X-Page-Cache"] = "miss"
+        # 쿠키가 붙은 응답은 캐시하지 않으므로 캐시 저장 뒤에 맞춤
+        self._sync_auth_cookie(request, response)
+        return response
+
+    def _sync_auth_cookie(self, request, response):
+        """캐시된 페이지의 스크립트가 사용자별 영역을 불러올지 판단하는 표시용 쿠키를
+        실제 로그인 상태에 맞춤 (관리자 로그인, 세션 만료, 쿠키 없이 남은 세션 포함)
+        """
+        name = settings.PAGE_CACHE_AUTH_COOKIE
+        marked = request.COOKIES.get(name) == "1"
+        if (
+            settings.SESSION_COOKIE_NAME in request.COOKIES
+            or request.session.accessed  # 로그인 요청 (세션 쿠키가 아직 없음)
+        ):
+            # 익명 기준으로 렌더링한 요청은 바꾸기 전 사용자로 판단
+            user = getattr(request, "page_cache_user", request.user)
+            authenticated = user.is_authenticated
+        else:
+            # 세션이 없는 익명 요청은 세션을 읽지 않음 (Vary: Cookie가 붙지 않도록)
+            authenticated = False
+        if authenticated and not marked:
+            response.set_cookie(
+                name,
+                "1",
+                max_age=(
+                    None
+                    if settings.SESSION_EXPIRE_AT_BROWSER_CLOSE
+                    else settings.SESSION_COOKIE_AGE
+                ),
+                samesite="Lax",
+            )
+        elif marked and not authenticated:
+            response.delete_cookie(name, samesite="Lax")
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if request.method not in ("GET", "HEAD"):
+            return None
+        if request.resolver_match.view_name not in getattr(settings, "PAGE_CACHE_VIEWS", ()):
+            return None
+
+        key = page_cache_key(request)
+        cached = cache_get(key)
+        if cached is not None:
+            hook = getattr(getattr(view_func, "view_class", None), "page_cache_hit", None)
+            if hook is not None:
+                hook(request, **view_kwargs)
+            response = HttpResponse(cached["content"], content_type=cached["content_type"])
+            response["X-Page-Cache"] = "hit"
+            return self._conditional(request, response, cached)
+
+        # 공유 본문은 항상 익명 사용자 기준으로 렌더링
+        request.page_cache_key = key
+        request.page_cache_render = True
+        request.cache_deps = {}
+        request.page_cache_user = request.user
+        request.user = AnonymousUser()
+        return None
+
+    def _conditional(self, request, response, cached):
+        """캐시된 본문에 저장해 둔 ETag/Last-Modified로 304 여부 판단"""
+        if cached.get("etag"):
+            response["ETag"] = cached.get("etag")
+        if cached.get("last_modified"):
+            response["Last-Modified"] = cached.get("last_modified")
+        return get_conditional_response(
+            request,
+            etag=cached.get("etag"),
+            last_modified=parse_http_date_safe(cached.get("last_modified") or ""),
+            response=response,
+        )
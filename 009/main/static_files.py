@@ -0,0 +1,434 @@
+# main/static_files.py
+"""배포용 정적 파일: 해시 이름 + 미리 압축 + WSGI 단계 서빙
+
+collectstatic (STORAGES["staticfiles"] = CompressedManifestStaticFilesStorage)
+    css/styles.css → css/styles.3f2a9c1b7e4d.css  (+ staticfiles.json 매니페스트)
+    텍스트 파일은 .gz (brotli 패키지가 있으면 .br도) 압축본을 함께 저장
+    배경 이미지(STATIC_IMAGE_VARIANT_PATTERNS)는 너비별 AVIF/WebP/JPEG 사본을 만들어
+    매니페스트에 추가 (assets/img/home-bg.1280w.webp, {% static_background %}에서 사용)
+    CSS_PURGE_STYLESHEETS는 사용하지 않는 규칙을 뺀 사본(css/styles.purged.css)과
+    첫 화면용 critical CSS(css/styles.critical.css)를 추가 ({% stylesheet %}에서 사용)
+
+config.wsgi (StaticFilesApp)
+    STATIC_URL 요청을 Django까지 보내지 않고 STATIC_ROOT에서 바로 응답합니다.
+    해시 이름은 1년 + immutable 캐시, Accept-Encoding에 맞는 압축본 선택,
+    ETag/Last-Modified(304)와 Range(206)를 처리하고, 본문은 wsgi.file_wrapper로
+    넘겨 gunicorn이 sendfile로 보내게 합니다.
+"""
+import gzip
+import json
+import mimetypes
+import os
+import re
+from email.utils import formatdate, parsedate_to_datetime
+from fnmatch import fnmatch
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.core.files.base import ContentFile
+from PIL import features
+
+from . import css_purge
+from .imaging import IMAGE_FORMATS, encode, load_image, resize
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성: pip install brotli
+    brotli = None
+
+COMPRESSIBLE_EXTENSIONS = {
+    ".css",
+    ".js",
+    ".map",
+    ".json",
+    ".svg",
+    ".txt",
+    ".html",
+    ".xml",
+    ".ico",
+    ".ttf",
+    ".otf",
+    ".eot",
+}
+
+# 압축 형식: (Content-Encoding, 확장자), 브라우저가 둘 다 받으면 앞의 것을 사용
+ENCODINGS = [("br", ".br"), ("gzip", ".gz")]
+
+IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60
+
+
+def static_image_widths():
+    return getattr(settings, "STATIC_IMAGE_VARIANT_WIDTHS", [640, 1280, 1920])
+
+
+def static_image_formats():
+    """이 Pillow에서 만들 수 있는 형식만"""
+    return {
+        ext: spec for ext, spec in IMAGE_FORMATS.items() if features.check(ext)
+    }
+
+
+def static_image_variant_name(name, width, ext):
+    """assets/img/home-bg.jpg → assets/img/home-bg.1280w.webp"""
+    return f"{os.path.splitext(name)[0]}.{width}w.{ext}"
+
+
+def stylesheet_variant_name(name, kind):
+    """css/styles.css → css/styles.purged.css / css/styles.critical.css"""
+    root, ext = os.path.splitext(name)
+    return f"{root}.{kind}{ext}"
+
+
+def _compress_gzip(data):
+    # mtime=0: 같은 내용이면 같은 압축본 (배포마다 바뀌지 않음)
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def _compress_brotli(data):
+    return brotli.compress(data, quality=11)
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    """해시 이름과 매니페스트를 만들고, 텍스트 파일의 압축본을 함께 저장"""
+
+    # 압축해도 이 비율보다 작아지지 않으면 압축본을 두지 않음
+    min_compression_ratio = 0.95
+    # collectstatic 전(테스트, DEBUG=False로 띄운 개발 서버)에도 {% static %}이 동작하도록
+    manifest_strict = False
+
+    def stored_name(self, name):
+        try:
+            return super().stored_name(name)
+        except ValueError:
+            # 매니페스트에도 STATIC_ROOT에도 없는 파일: 해시 없는 원래 이름
+            return name
+
+    def post_process(self, paths, dry_run=False, **options):
+        processed_names = set()
+        for name, hashed_name, processed in super().post_process(
+            paths, dry_run, **options
+        ):
+            if processed and not isinstance(processed, Exception):
+                processed_names.update([name, hashed_name])
+            yield name, hashed_name, processed
+
+        if dry_run:
+            return
+        variants = list(self.make_image_variants(paths))
+        variants += self.purge_stylesheets(paths)
+        if variants:
+            self.save_manifest()
+        yield from variants
+        processed_names.update(hashed for _, hashed, _ in variants)
+        for name in sorted(processed_names | set(paths)):
+            if os.path.splitext(name)[1].lower() in COMPRESSIBLE_EXTENSIONS:
+                self.compress(name)
+
+    def make_image_variants(self, paths):
+        """배경 이미지의 너비별 사본을 저장하고 매니페스트에 등록
+
+        사본 이름에 원본의 해시가 들어가므로 원본이 그대로면 다시 만들지 않습니다.
+        (원본보다 큰 너비는 원본 크기로 저장)
+        """
+        patterns = getattr(settings, "STATIC_IMAGE_VARIANT_PATTERNS", [])
+        formats = static_image_formats()
+        for name in sorted(paths):
+            if not any(fnmatch(name, pattern) for pattern in patterns):
+                continue
+            hashed_name = self.stored_name(name)
+            image = None
+            for width in static_image_widths():
+                resized = None
+                for ext in formats:
+                    variant = static_image_variant_name(name, width, ext)
+                    hashed_variant = static_image_variant_name(hashed_name, width, ext)
+                    if not self.exists(hashed_variant):
+                        if image is None:
+                            with self.open(hashed_name) as file:
+                                image, _ = load_image(file, max(static_image_widths()))
+                        if resized is None:
+                            resized = resize(image, width)
+                        self._save(hashed_variant, ContentFile(encode(resized, ext)))
+                    self.hashed_files[self.hash_key(variant)] = hashed_variant
+                    yield variant, hashed_variant, True
+
+    def purge_stylesheets(self, paths):
+        """CSS_PURGE_STYLESHEETS의 purged/critical 사본을 저장하고 매니페스트에 등록"""
+        names = [
+            name
+            for name in getattr(settings, "CSS_PURGE_STYLESHEETS", [])
+            if name in paths
+        ]
+        if not names:
+            return []
+        used = css_purge.content_tokens()
+        critical = css_purge.critical_tokens()
+        saved = []
+        for name in names:
+            hashed_name = self.stored_name(name)
+            with self.open(hashed_name) as file:
+                css = file.read().decode("utf-8")
+            # <style>로 넣으면 페이지 기준이 되므로 상대 url()을 절대 경로로
+            base_url = self.base_url + os.path.dirname(hashed_name) + "/"
+            outputs = {
+                "purged": css_purge.purge(css, used),
+                "critical": css_purge.absolutize_urls(
+                    css_purge.purge(css, critical), base_url
+                ),
+            }
+            for kind, output in outputs.items():
+                variant = stylesheet_variant_name(name, kind)
+                content = ContentFile(output.encode("utf-8"))
+                hashed_variant = self.hashed_name(variant, content)
+                if not self.exists(hashed_variant):
+                    self._save(hashed_variant, content)
+                self.hashed_files[self.hash_key(variant)] = hashed_variant
+                saved.append((variant, hashed_variant, True))
+        return saved
+
+    def compress(self, name):
+        """name 옆에 .gz(.br) 압축본 저장 (원본보다 새 압축본이 있으면 건너뜀)"""
+        path = self.path(name)
+        if not os.path.exists(path):
+            return
+        with open(path, "rb") as file:
+            data = file.read()
+        compressors = [(".gz", _compress_gzip)]
+        if brotli is not None:
+            compressors.append((".br", _compress_brotli))
+        for ext, compress in compressors:
+            target = path + ext
+            if (
+                os.path.exists(target)
+                and os.path.getmtime(target) >= os.path.getmtime(path)
+            ):
+                continue
+            compressed = compress(data)
+            if len(compressed) <= len(data) * self.min_compression_ratio:
+                with open(target, "wb") as file:
+                    file.write(compressed)
+            elif os.path.exists(target):
+                os.remove(target)
+
+
+class StaticFile:
+    """STATIC_ROOT의 파일 하나 (원본과 압축본별 경로/크기/ETag)"""
+
+    def __init__(self, path, immutable):
+        self.immutable = immutable
+        content_type, _ = mimetypes.guess_type(path)
+        content_type = content_type or "application/octet-stream"
+        if content_type.startswith("text/") or content_type in (
+            "application/javascript",
+            "application/json",
+            "image/svg+xml",
+        ):
+            content_type += "; charset=utf-8"
+        self.content_type = content_type
+
+        stat = os.stat(path)
+        self.last_modified = formatdate(stat.st_mtime, usegmt=True)
+        self.mtime = int(stat.st_mtime)
+        # 인코딩(None=원본) → (경로, 크기, ETag)
+        self.variants = {None: (path, stat.st_size, self._etag(stat, ""))}
+        for encoding, ext in ENCODINGS:
+            if os.path.exists(path + ext):
+                encoded_stat = os.stat(path + ext)
+                self.variants[encoding] = (
+                    path + ext,
+                    encoded_stat.st_size,
+                    self._etag(encoded_stat, "-" + encoding),
+                )
+
+    @staticmethod
+    def _etag(stat, suffix):
+        return f'"{stat.st_size:x}-{int(stat.st_mtime):x}{suffix}"'
+
+
+class StaticFilesApp:
+    """STATIC_URL 요청을 STATIC_ROOT에서 바로 응답하는 WSGI 미들웨어
+
+    파일 목록은 시작할 때 한 번 읽습니다. (배포 후 collectstatic 결과는 바뀌지 않음)
+    """
+
+    def __init__(self, application, root=None, prefix=None, max_age=None):
+        self.application = application
+        self.root = root or settings.STATIC_ROOT
+        self.prefix = prefix or settings.STATIC_URL
+        if not self.prefix.startswith("/"):
+            self.prefix = "/" + self.prefix
+        self.max_age = (
+            max_age
+            if max_age is not None
+            else getattr(settings, "STATIC_SERVE_MAX_AGE", 60)
+        )
+        self.files = self._scan()
+
+    def _scan(self):
+        files = {}
+        if not self.root or not os.path.isdir(self.root):
+            return files
+        hashed = set()
+        try:
+            with open(os.path.join(self.root, "staticfiles.json")) as file:
+                hashed.update(json.load(file).get("paths", {}).values())
+        except (OSError, ValueError):
+            pass
+        compressed_exts = tuple(ext for _, ext in ENCODINGS)
+        for directory, _, names in os.walk(self.root):
+            for name in names:
+                if name.endswith(compressed_exts):
+                    continue
+                path = os.path.join(directory, name)
+                relative = os.path.relpath(path, self.root).replace(os.sep, "/")
+                files[self.prefix + relative] = StaticFile(path, relative in hashed)
+        return files
+
+    def __call__(self, environ, start_response):
+        path = environ.get("PATH_INFO", "")
+        if not path.startswith(self.prefix) or not self.files:
+            return self.application(environ, start_response)
+        static_file = self.files.get(path)
+        if static_file is None:
+            return self._respond(start_response, "404 Not Found", [], b"Not Found")
+        if environ["REQUEST_METHOD"] not in ("GET", "HEAD"):
+            return self._respond(
+                start_response,
+                "405 Method Not Allowed",
+                [("Allow", "GET, HEAD")],
+                b"Method Not Allowed",
+            )
+        return self.serve(static_file, environ, start_response)
+
+    def serve(self, static_file, environ, start_response):
+        range_header = environ.get("HTTP_RANGE")
+        # 범위 요청은 원본 기준으로 응답 (압축본의 바이트 범위는 의미가 없음)
+        encoding = None if range_header else self._negotiate(static_file, environ)
+        path, size, etag = static_file.variants[encoding]
+
+        headers = [
+            ("Content-Type", static_file.content_type),
+            ("Last-Modified", static_file.last_modified),
+            ("ETag", etag),
+            ("Cache-Control", self._cache_control(static_file)),
+            ("Accept-Ranges", "bytes"),
+        ]
+        if len(static_file.variants) > 1:
+            headers.append(("Vary", "Accept-Encoding"))
+        if encoding:
+            headers.append(("Content-Encoding", encoding))
+
+        if self._not_modified(static_file, etag, environ):
+            start_response("304 Not Modified", headers)
+            return []
+
+        status, start, length = "200 OK", 0, size
+        if range_header and self._range_applies(static_file, etag, environ):
+            byte_range = self._parse_range(range_header, size)
+            if byte_range is None:
+                headers.append(("Content-Range", f"bytes */{size}"))
+                return self._respond(
+                    start_response, "416 Range Not Satisfiable", headers, b""
+                )
+            if byte_range is not False:
+                start, end = byte_range
+                status, length = "206 Partial Content", end - start + 1
+                headers.append(("Content-Range", f"bytes {start}-{end}/{size}"))
+
+        headers.append(("Content-Length", str(length)))
+        start_response(status, headers)
+        if environ["REQUEST_METHOD"] == "HEAD":
+            return []
+        file = open(path, "rb")
+        if start:
+            file.seek(start)
+        if length == size and "wsgi.file_wrapper" in environ:
+            # gunicorn은 파일 객체를 받으면 sendfile()로 커널에서 바로 보냄
+            return environ["wsgi.file_wrapper"](file, 64 * 1024)
+        return self._read_range(file, length)
+
+    def _cache_control(self, static_file):
+        if static_file.immutable:
+            return f"public, max-age={IMMUTABLE_MAX_AGE}, immutable"
+        return f"public, max-age={self.max_age}"
+
+    @staticmethod
+    def _negotiate(static_file, environ):
+        """Accept-Encoding에서 받을 수 있는(q>0) 압축본 중 우선순위가 높은 것"""
+        accepted = {}
+        for item in environ.get("HTTP_ACCEPT_ENCODING", "").split(","):
+            coding, _, params = item.strip().partition(";")
+            quality = 1.0
+            match = re.search(r"q=([0-9.]+)", params)
+            if match:
+                try:
+                    quality = float(match.group(1))
+                except ValueError:
+                    quality = 0
+            accepted[coding.strip().lower()] = quality
+        for encoding, _ in ENCODINGS:
+            quality = accepted.get(encoding, accepted.get("*", 0))
+            if encoding in static_file.variants and quality > 0:
+                return encoding
+        return None
+
+    @staticmethod
+    def _not_modified(static_file, etag, environ):
+        if_none_match = environ.get("HTTP_IF_NONE_MATCH")
+        if if_none_match:
+            tags = [tag.strip() for tag in if_none_match.split(",")]
+            return "*" in tags or etag in tags or f"W/{etag}" in tags
+        if_modified_since = environ.get("HTTP_IF_MODIFIED_SINCE")
+        if if_modified_since:
+            try:
+                since = parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+            return static_file.mtime <= since
+        return False
+
+    @staticmethod
+    def _range_applies(static_file, etag, environ):
+        """If-Range가 있으면 파일이 그대로일 때만 범위 응답"""
+        if_range = environ.get("HTTP_IF_RANGE")
+        return not if_range or if_range in (etag, static_file.last_modified)
+
+    @staticmethod
+    def _parse_range(header, size):
+        """(start, end) / 범위를 무시하고 전체 응답이면 False / 만족할 수 없으면 None"""
+        unit, _, spec = header.partition("=")
+        if unit.strip() != "bytes" or "," in spec:
+            # 여러 범위(multipart)는 지원하지 않으므로 전체 응답
+            return False
+        first, _, last = spec.strip().partition("-")
+        try:
+            if not first:
+                suffix = int(last)
+                if suffix <= 0:
+                    return None
+                return max(size - suffix, 0), size - 1
+            start = int(first)
+            end = int(last) if last else size - 1
+        except ValueError:
+            return False
+        if start >= size or end < start:
+            return None
+        return start, min(end, size - 1)
+
+    @staticmethod
+    def _read_range(file, length, block_size=64 * 1024):
+        try:
+            while length > 0:
+                chunk = file.read(min(block_size, length))
+                if not chunk:
+                    break
+                length -= len(chunk)
+                yield chunk
+        finally:
+            file.close()
+
+    @staticmethod
+    def _respond(start_response, status, headers, body):
+        headers = headers + [("Content-Length", str(len(body)))]
+        start_response(status, headers)
+        return [body]
@@ -0,0 +1,117 @@
+# main/storage.py
+"""내용 주소(content-addressed) 업로드 저장소
+
+업로드 파일 이름을 내용의 SHA-256 해시로 정하고, 해시 앞자리로 디렉터리를
+나눠(sharding) 한 디렉터리에 파일이 몰리지 않게 합니다.
+
+    post_images/photo.jpg → post_images/3a/7b/3a7bd3e2...c1.jpg
+
+같은 내용을 다시 올리면 새로 저장하지 않고 참조 수(StoredFile.ref_count)만
+늘리며, delete()는 참조 수를 줄이다가 0이 되면 파일을 지웁니다.
+모델 필드에서는 storage=upload_storage로 사용합니다. (settings.STORAGES["uploads"])
+"""
+import hashlib
+import os
+import tempfile
+
+from django.core.files.storage import FileSystemStorage, storages
+from django.db import transaction
+from django.db.models import F
+from django.utils.deconstruct import deconstructible
+
+INCOMING_DIR = ".incoming"  # 해시를 계산하며 받는 중인 임시 파일
+
+
+def upload_storage():
+    """업로드 이미지 필드용 저장소 (마이그레이션에는 이 함수 경로가 기록됨)"""
+    return storages["uploads"]
+
+
+@deconstructible(path="main.storage.ContentAddressedStorage")
+class ContentAddressedStorage(FileSystemStorage):
+    def __init__(self, *args, shard_depth=2, shard_width=2, **kwargs):
+        self.shard_depth = shard_depth
+        self.shard_width = shard_width
+        super().__init__(*args, **kwargs)
+
+    def hashed_name(self, name, digest):
+        """upload_to 디렉터리 + 해시 샤드 디렉터리 + 해시.확장자"""
+        directory = os.path.dirname(name)
+        ext = os.path.splitext(name)[1].lower()
+        shards = [
+            digest[i * self.shard_width : (i + 1) * self.shard_width]
+            for i in range(self.shard_depth)
+        ]
+        return "/".join(filter(None, [directory, *shards, digest + ext]))
+
+    def get_available_name(self, name, max_length=None):
+        # 실제 이름은 _save에서 내용으로 정해지므로 겹치는 이름을 찾지 않음
+        return name
+
+    def _save(self, name, content):
+        temp_path, digest, size = self._receive(content)
+        name = self.hashed_name(name, digest)
+        full_path = self.path(name)
+        try:
+            with transaction.atomic():
+                self._acquire(name, size)
+                # 참조 수를 올린 뒤(쓰기 잠금 안에서) 파일을 두므로
+                # 동시에 마지막 참조를 해제하는 delete()와 엇갈리지 않음
+                if not os.path.exists(full_path):
+                    os.makedirs(os.path.dirname(full_path), exist_ok=True)
+                    os.replace(temp_path, full_path)
+                    if self.file_permissions_mode is not None:
+                        os.chmod(full_path, self.file_permissions_mode)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        return name
+
+    def _receive(self, content):
+        """업로드를 임시 파일로 스트리밍하면서 해시 계산 → (경로, 해시, 크기)"""
+        directory = self.path(INCOMING_DIR)
+        os.makedirs(directory, exist_ok=True)
+        sha256 = hashlib.sha256()
+        size = 0
+        with tempfile.NamedTemporaryFile(dir=directory, delete=False) as temp:
+            try:
+                if hasattr(content, "seek"):
+                    content.seek(0)
+                for chunk in content.chunks():
+                    if isinstance(chunk, str):
+                        chunk = chunk.encode()
+                    sha256.update(chunk)
+                    temp.write(chunk)
+                    size += len(chunk)
+            except BaseException:
+                temp.close()
+                os.remove(temp.name)
+                raise
+        return temp.name, sha256.hexdigest(), size
+
+    def _acquire(self, name, size):
+        from .models import StoredFile
+
+        stored, created = StoredFile.objects.select_for_update().get_or_create(
+            name=name, defaults={"size": size, "ref_count": 1}
+        )
+        if not created:
+            StoredFile.objects.filter(pk=stored.pk).update(
+                ref_count=F("ref_count") + 1
+            )
+
+    def delete(self, name):
+        """참조 하나 해제 (마지막 참조면 파일 삭제)"""
+        from .models import StoredFile
+
+        with transaction.atomic():
+            stored = StoredFile.objects.select_for_update().filter(name=name).first()
+            if stored is not None and stored.ref_count > 1:
+                StoredFile.objects.filter(pk=stored.pk).update(
+                    ref_count=F("ref_count") - 1
+                )
+                return
+            if stored is not None:
+                stored.delete()
+            # 기록이 없는 파일(이 저장소 이전에 올라온 파일)은 바로 삭제
+            super().delete(name)
@@ -0,0 +1,88 @@
+# main/template_loaders.py
+"""공백을 줄인 템플릿을 캐시하는 로더
+
+cached 로더처럼 템플릿을 한 번만 읽고 파싱하되, 처음 컴파일할 때 .html 템플릿의
+텍스트 노드에서 들여쓰기/줄바꿈 공백을 하나로 줄이고 HTML 주석을 지웁니다.
+변수/태그가 렌더링한 값은 건드리지 않으며, <pre>, <textarea>, <script>, <style>
+안의 내용은 그대로 둡니다. (여러 공백은 브라우저에서 한 칸으로 보이므로 화면은 같음)
+
+    TEMPLATES OPTIONS "loaders": [("main.template_loaders.Loader", [...])]
+
+서버 시작 때 warm_templates()로 프로젝트 템플릿을 미리 컴파일해 두므로(config/wsgi.py)
+첫 요청부터 파싱/공백 처리 비용이 없습니다.
+"""
+import logging
+import os
+import re
+
+from django.template import engines
+from django.template.base import TextNode
+from django.template.loaders import cached
+
+logger = logging.getLogger(__name__)
+
+# 안의 공백이 의미가 있는 요소
+PRESERVE_TAG_RE = re.compile(r"<(/?)(pre|textarea|script|style)\b[^>]*>", re.I)
+# 조건부 주석(<!--[if IE]>)은 유지
+HTML_COMMENT_RE = re.compile(r"<!--(?!\[if).*?-->", re.S)
+# \s는 &nbsp;(\xa0)도 포함하므로 HTML 공백 문자만
+WHITESPACE_RE = re.compile(r"[ \t\r\n\f]+")
+
+
+def _collapse(text):
+    text = HTML_COMMENT_RE.sub("", text)
+    # 줄바꿈이 있던 자리는 줄바꿈 하나로 (소스 보기에서 줄 구분 유지)
+    return WHITESPACE_RE.sub(
+        lambda match: "\n" if "\n" in match.group() else " ", text
+    )
+
+
+def minify_template(template):
+    """템플릿의 텍스트 노드 공백을 줄임 (문서 순서대로, 보존 요소 안인지 추적)"""
+    preserving = None
+    for node in template.nodelist.get_nodes_by_type(TextNode):
+        parts, position = [], 0
+        for match in PRESERVE_TAG_RE.finditer(node.s):
+            segment = node.s[position : match.start()]
+            parts.append(segment if preserving else _collapse(segment))
+            parts.append(match.group())
+            closing, tag = match.group(1), match.group(2).lower()
+            if closing and tag == preserving:
+                preserving = None
+            elif not closing and preserving is None:
+                preserving = tag
+            position = match.end()
+        segment = node.s[position:]
+        parts.append(segment if preserving else _collapse(segment))
+        node.s = "".join(parts)
+
+
+class Loader(cached.Loader):
+    def get_template(self, template_name, skip=None):
+        template = super().get_template(template_name, skip)
+        # 캐시에 있던 템플릿은 이미 처리됨
+        if not getattr(template, "minified", False):
+            if template_name.endswith(".html"):
+                minify_template(template)
+            template.minified = True
+        return template
+
+
+def warm_templates():
+    """TEMPLATES DIRS 아래 모든 .html 템플릿을 미리 컴파일, 컴파일한 수"""
+    count = 0
+    for engine in engines.all():
+        for directory in getattr(engine, "template_dirs", ()):
+            for root, _, files in os.walk(directory):
+                for filename in sorted(files):
+                    if not filename.endswith(".html"):
+                        continue
+                    name = os.path.relpath(os.path.join(root, filename), directory)
+                    try:
+                        engine.get_template(name.replace(os.sep, "/"))
+                    except Exception:
+                        # 깨진 템플릿이 서버 시작을 막지 않도록 (요청 때 다시 오류)
+                        logger.exception("템플릿 미리 컴파일 실패: %s", name)
+                    else:
+                        count += 1
+    return count
@@ -0,0 +1,27 @@
+# main/templatetags/page_fragments.py
+from urllib.parse import urlencode
+
+from django import template
+from django.utils.html import format_html
+
+from main.fragments import HOLES
+
+register = template.Library()
+
+
+@register.simple_tag(takes_context=True)
+def hole(context, name, **params):
+    """사용자별 영역을 현재 컨텍스트로 렌더링하고 data-hole 속성으로 감쌈
+
+    사용법: {% hole "post_actions" post_id=post.pk %}
+    """
+    template_name, _ = HOLES[name]
+    inner = context.template.engine.get_template(template_name)
+    with context.push(**params):
+        html = inner.render(context)
+    return format_html(
+        '<div data-hole="{}" data-hole-params="{}" style="display: contents">{}</div>',
+        name,
+        urlencode(params),
+        html,
+    )
@@ -0,0 +1,189 @@
+# main/templatetags/responsive_images.py
+from django import template
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.templatetags.static import static
+from django.utils.html import format_html, format_html_join
+from django.utils.safestring import mark_safe
+
+from main.imaging import FORMATS, variant_url
+from main.static_files import (
+    static_image_formats,
+    static_image_variant_name,
+    static_image_widths,
+)
+
+register = template.Library()
+
+
+def _variants(fieldfile):
+    """(필드, 너비 목록), 파생 이미지가 아직 없으면 너비 목록은 비어 있음"""
+    field, instance = fieldfile.field, fieldfile.instance
+    if not field.is_ready(instance):
+        return field, []
+    return field, field.widths(instance)
+
+
+def _srcset(name, widths, ext):
+    return ", ".join(f"{variant_url(name, width, ext)} {width}w" for width in widths)
+
+
+@register.simple_tag
+def responsive_img(fieldfile, alt="", sizes=None, css_class="", width=None):
+    """파생 이미지 srcset을 쓰는 <picture> (준비 전이면 원본 <img>)
+
+    width를 주면 그 너비(px)로 표시 (height는 비율대로, sizes 기본값도 그 너비)
+
+    사용법: {% responsive_img user.profile_image alt=user.get_display_name width=32 %}
+    """
+    if not fieldfile:
+        return ""
+    field, widths = _variants(fieldfile)
+    instance = fieldfile.instance
+    display_width = int(width) if width else None
+    width = getattr(instance, field.width_field) if field.width_field else None
+    height = getattr(instance, field.height_field) if field.height_field else None
+    if display_width and width and height:
+        width, height = display_width, max(1, round(height * display_width / width))
+    if sizes is None:
+        sizes = f"{display_width}px" if display_width else "100vw"
+    size = (
+        format_html(' width="{}" height="{}"', width, height) if width and height else ""
+    )
+    if not widths:
+        return format_html(
+            '<img src="{}" alt="{}" class="{}"{} loading="lazy" decoding="async">',
+            fieldfile.url,
+            alt,
+            css_class,
+            size,
+        )
+
+    placeholder = getattr(instance, field.placeholder_field)
+    sources = format_html_join(
+        "",
+        '<source type="{}" srcset="{}" sizes="{}">',
+        (
+            (mime, _srcset(fieldfile.name, widths, ext), sizes)
+            for ext, (_, mime, _) in FORMATS.items()
+            if ext != "jpg"
+        ),
+    )
+    return format_html(
+        "<picture>{}"
+        '<img src="{}" srcset="{}" sizes="{}" alt="{}" class="{}"{}'
+        ' loading="lazy" decoding="async"'
+        ' style="background: url({}) center / cover no-repeat">'
+        "</picture>",
+        sources,
+        variant_url(fieldfile.name, widths[-1], "jpg"),
+        _srcset(fieldfile.name, widths, "jpg"),
+        sizes,
+        alt,
+        css_class,
+        size,
+        placeholder,
+    )
+
+
+def _background_rules(selector, widths, image_set):
+    """화면 너비(고해상도 화면은 두 배)에 맞는 가장 작은 사본을 고르는 CSS 규칙
+
+    image_set(width)는 그 너비 사본의 background-image 선언
+    """
+    rules = [f"{selector} {{ {image_set(widths[0])} }}"]
+    for previous, width in zip(widths, widths[1:]):
+        rules.append(
+            f"@media (min-width: {previous + 1}px), (min-resolution: 2dppx) and"
+            f" (min-width: {previous // 2 + 1}px) {{ {selector} {{"
+            f" {image_set(width)} }} }}"
+        )
+    return rules
+
+
+@register.simple_tag
+def media_background(fieldfile, selector="header.masthead"):
+    """업로드 이미지의 너비별 파생 이미지로 배경 이미지를 지정하는 <style>
+
+    {% static_background %}처럼 화면 너비에 맞는 사본을 media query로 고르고,
+    이미지를 받는 동안은 placeholder를 아래 층에 보여 줍니다.
+    파생 이미지가 아직 없으면 원본을 그대로 씁니다.
+
+    사용법: {% media_background post.thumbnail %}<header class="masthead">
+    """
+    if not fieldfile:
+        return ""
+    field, widths = _variants(fieldfile)
+    if not widths:
+        return format_html(
+            "<style>{} {{ background-image: url('{}'); }}</style>",
+            mark_safe(selector),
+            fieldfile.url,
+        )
+
+    name = fieldfile.name
+    placeholder = getattr(fieldfile.instance, field.placeholder_field)
+
+    def image_set(width):
+        urls = ", ".join(
+            f"url('{variant_url(name, width, ext)}') type('{mime}')"
+            for ext, (_, mime, _) in FORMATS.items()
+        )
+        # image-set을 모르는 브라우저는 앞의 선언(JPEG)을 그대로 사용
+        return (
+            f"background-image: url('{variant_url(name, width, 'jpg')}'),"
+            f" var(--placeholder); background-image: image-set({urls}),"
+            f" var(--placeholder);"
+        )
+
+    rules = [f"{selector} {{ --placeholder: url('{placeholder}'); }}"]
+    rules += _background_rules(selector, widths, image_set)
+    # storage.url()이 만든 URL은 인코딩되어 있고 placeholder는 base64 data URI
+    return mark_safe("<style>" + " ".join(rules) + "</style>")
+
+
+def _static_image_set(path, width, formats):
+    """image-set을 모르는 브라우저는 앞의 선언(JPEG)을 그대로 사용"""
+    urls = {
+        ext: static(static_image_variant_name(path, width, ext)) for ext in formats
+    }
+    image_set = ", ".join(
+        f"url('{urls[ext]}') type('{mime}')" for ext, (_, mime, _) in formats.items()
+    )
+    return (
+        f"background-image: url('{urls['jpg']}');"
+        f" background-image: image-set({image_set});"
+    )
+
+
+@register.simple_tag
+def static_background(path, selector="header.masthead"):
+    """collectstatic이 만든 너비별 사본으로 배경 이미지를 지정하는 <style>
+
+    화면 너비(고해상도 화면은 두 배)에 맞는 가장 작은 사본을 media query로 고르고,
+    image-set으로 브라우저가 지원하는 형식(AVIF → WebP → JPEG)을 고르게 합니다.
+    사본이 없으면(개발 환경 등) 원본을 그대로 씁니다.
+    테마 CSS의 header.masthead { background: ... } 단축 속성에 덮이지 않도록
+    선택자 우선순위를 같게 두고 (문서에서 뒤에 오므로 이 규칙이 적용됨)
+
+    사용법: {% static_background "assets/img/home-bg.jpg" %}<header class="masthead">
+    """
+    hashed_files = getattr(staticfiles_storage, "hashed_files", {})
+    formats = static_image_formats()
+    widths = [
+        width
+        for width in static_image_widths()
+        if "jpg" in formats
+        and all(
+            static_image_variant_name(path, width, ext) in hashed_files
+            for ext in formats
+        )
+    ]
+    if settings.DEBUG or not widths:
+        rules = [f"{selector} {{ background-image: url('{static(path)}'); }}"]
+    else:
+        rules = _background_rules(
+            selector, widths, lambda width: _static_image_set(path, width, formats)
+        )
+    # static()이 만든 URL은 따옴표/꺾쇠가 인코딩되어 있으므로 그대로 넣음
+    return mark_safe("<style>" + " ".join(rules) + "</style>")
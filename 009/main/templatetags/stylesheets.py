@@ -0,0 +1,48 @@
+# main/templatetags/stylesheets.py
+from functools import lru_cache
+
+from django import template
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.templatetags.static import static
+from django.utils.html import format_html
+from django.utils.safestring import mark_safe
+
+from main.static_files import stylesheet_variant_name
+
+register = template.Library()
+
+
+@lru_cache(maxsize=16)
+def _read(hashed_name):
+    # 해시 이름이므로 내용이 바뀌지 않아 프로세스 동안 캐시
+    with staticfiles_storage.open(hashed_name) as file:
+        return file.read().decode("utf-8")
+
+
+@register.simple_tag
+def stylesheet(path):
+    """CSS 링크 (collectstatic이 purged/critical 사본을 만들었으면 그것을 사용)
+
+    critical CSS(내비게이션, 마스트헤드)는 <style>로 넣고, 나머지(purged)는
+    렌더링을 막지 않도록 preload로 받아 적용합니다.
+
+    사용법: {% stylesheet "css/styles.css" %}
+    """
+    hashed_files = getattr(staticfiles_storage, "hashed_files", {})
+    purged = stylesheet_variant_name(path, "purged")
+    critical = stylesheet_variant_name(path, "critical")
+    if settings.DEBUG or purged not in hashed_files or critical not in hashed_files:
+        return format_html('<link href="{}" rel="stylesheet" />', static(path))
+
+    css = _read(hashed_files[critical]).replace("</", "<\\/")
+    href = static(purged)
+    return format_html(
+        "<style>{}</style>\n"
+        '    <link rel="preload" href="{}" as="style"'
+        " onload=\"this.onload=null;this.rel='stylesheet'\" />\n"
+        '    <noscript><link href="{}" rel="stylesheet" /></noscript>',
+        mark_safe(css),
+        href,
+        href,
+    )
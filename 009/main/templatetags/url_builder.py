@@ -0,0 +1,15 @@
+# main/templatetags/url_builder.py
+from django import template
+
+from main.url_builder import build_url
+
+register = template.Library()
+
+
+@register.simple_tag
+def url_for(viewname, *args, **kwargs):
+    """{% url %}과 같은 경로를 미리 만든 틀로 (반복문 안에서 사용)
+
+    사용법: {% url_for 'blog:comment_update' comment.pk %}
+    """
+    return build_url(viewname, *args, **kwargs)
@@ -1,3 +1,185 @@
-from django.test import TestCase
+import io
+import os
+import tempfile
 
-# Create your tests here.
+from django.core.files.base import ContentFile
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import transaction
+from django.test import RequestFactory, TestCase, TransactionTestCase, override_settings
+from PIL import Image
+
+from accounts.models import User
+from blog.models import Post
+
+from . import cache_deps
+from .models import StoredFile
+from .storage import upload_storage
+from .write_queue import WriteQueue
+
+# 개발 서버와 공유하는 파일 캐시를 쓰지 않도록
+LOCMEM_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "deps": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "counters": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+}
+
+
+@override_settings(STATIC_ROOT=tempfile.mkdtemp(), CACHES=LOCMEM_CACHES)
+class PageSmokeTest(TestCase):
+    """collectstatic 없이(매니페스트 없음, DEBUG=False) 주요 페이지가 열리는지"""
+
+    @classmethod
+    def setUpTestData(cls):
+        author = User.objects.create_user(username="writer", password="pw")
+        cls.post = Post.objects.create(
+            author=author, title="첫 글", content="# 안녕\n\n본문", is_published=True
+        )
+
+    def test_pages(self):
+        for url in ["/", "/about/", "/blog/", self.post.get_absolute_url()]:
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+                self.assertContains(response, "/static/assets/favicon.ico")
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class CacheDepsTest(TestCase):
+    def test_bump_invalidates_dependents_only(self):
+        cache_deps.cache_set("a", "A", ["post:1", "tags"])
+        cache_deps.cache_set("b", "B", ["post:2"])
+        self.assertEqual(cache_deps.cache_get("a"), "A")
+
+        cache_deps.bump("post:1")
+        self.assertIsNone(cache_deps.cache_get("a"))
+        self.assertEqual(cache_deps.cache_get("b"), "B")
+
+    def test_versions_increase(self):
+        before = cache_deps.get_version("post:1")
+        cache_deps.bump("post:1")
+        cache_deps.bump("post:1")
+        self.assertGreater(cache_deps.get_version("post:1"), before)
+
+    def test_depends_on_records_version_before_read(self):
+        """읽는 도중 바뀐 데이터로 만든 항목은 저장해도 바로 무효"""
+        request = RequestFactory().get("/")
+        request.cache_deps = {}
+        cache_deps.depends_on(request, "post:1")
+        cache_deps.bump("post:1")
+        cache_deps.cache_set("page", "old", request.cache_deps)
+        self.assertIsNone(cache_deps.cache_get("page"))
+
+    def test_bump_on_commit(self):
+        cache_deps.cache_set("a", "A", ["post:1"])
+        with self.captureOnCommitCallbacks(execute=True):
+            cache_deps.bump_on_commit("post:1")
+            self.assertEqual(cache_deps.cache_get("a"), "A")
+        self.assertIsNone(cache_deps.cache_get("a"))
+
+
+@override_settings(WRITE_QUEUE_ENABLED=True, WRITE_QUEUE_BATCH_WINDOW=0.2)
+class WriteQueueTest(TransactionTestCase):
+    """쓰기 스레드가 실제로 동작하도록 테스트 트랜잭션 밖에서 실행"""
+
+    def setUp(self):
+        self.queue = WriteQueue()
+        self.events = []
+
+    def write(self, name, fail=False):
+        StoredFile.objects.create(name=name)
+        self.events.append(f"run {name}")
+        transaction.on_commit(lambda: self.events.append(f"commit {name}"))
+        if fail:
+            raise ValueError(name)
+        return name
+
+    def test_group_commit(self):
+        futures = [self.queue.submit(self.write, name) for name in "abc"]
+        self.assertEqual([future.result(timeout=5) for future in futures], list("abc"))
+        # 세 작업이 모두 실행된 뒤 한 번에 커밋됨
+        self.assertEqual(
+            self.events, ["run a", "run b", "run c", "commit a", "commit b", "commit c"]
+        )
+        self.assertEqual(StoredFile.objects.count(), 3)
+
+    def test_error_stays_with_its_caller(self):
+        futures = [
+            self.queue.submit(self.write, "a"),
+            self.queue.submit(self.write, "b", fail=True),
+            self.queue.submit(self.write, "c"),
+        ]
+        self.assertEqual(futures[0].result(timeout=5), "a")
+        with self.assertRaisesMessage(ValueError, "b"):
+            futures[1].result(timeout=5)
+        self.assertEqual(futures[2].result(timeout=5), "c")
+        # 실패한 작업의 쓰기만 되돌림
+        self.assertEqual(
+            sorted(StoredFile.objects.values_list("name", flat=True)), ["a", "c"]
+        )
+
+    def test_run_inside_transaction_is_immediate(self):
+        with transaction.atomic():
+            self.assertEqual(self.queue.run(self.write, "a"), "a")
+            self.assertIsNone(self.queue._thread)
+        with self.assertRaises(ValueError):
+            with transaction.atomic():
+                self.queue.run(self.write, "b", fail=True)
+        self.assertEqual(list(StoredFile.objects.values_list("name", flat=True)), ["a"])
+
+
+def _jpeg(color):
+    data = io.BytesIO()
+    Image.new("RGB", (40, 30), color).save(data, "JPEG")
+    return SimpleUploadedFile("photo.jpg", data.getvalue(), content_type="image/jpeg")
+
+
+@override_settings(MEDIA_ROOT=tempfile.mkdtemp(), CACHES=LOCMEM_CACHES)
+class StoredFileTest(TestCase):
+    def refs(self, name):
+        stored = StoredFile.objects.filter(name=name).first()
+        return stored.ref_count if stored else 0
+
+    def test_same_content_is_stored_once(self):
+        storage = upload_storage()
+        first = storage.save("docs/a.txt", ContentFile(b"hello"))
+        second = storage.save("docs/b.txt", ContentFile(b"hello"))
+        self.assertEqual(first, second)
+        self.assertEqual(self.refs(first), 2)
+
+        storage.delete(first)
+        self.assertEqual(self.refs(first), 1)
+        self.assertTrue(storage.exists(first))
+        storage.delete(first)
+        self.assertEqual(self.refs(first), 0)
+        self.assertFalse(os.path.exists(storage.path(first)))
+
+    def save_image(self, user, color):
+        with self.captureOnCommitCallbacks(execute=True):
+            user.profile_image = _jpeg(color)
+            user.save()
+        return user.profile_image.name
+
+    def test_field_replace_reupload_and_delete(self):
+        user = User.objects.create_user(username="writer", password="pw")
+        red = self.save_image(user, "red")
+        self.assertEqual(self.refs(red), 1)
+
+        # 같은 내용을 다시 올리면 이름이 같고 참조 수도 그대로
+        self.assertEqual(self.save_image(User.objects.get(pk=user.pk), "red"), red)
+        self.assertEqual(self.refs(red), 1)
+
+        # 다른 사용자가 같은 내용을 올리면 파일을 함께 씀
+        other = User.objects.create_user(username="reader", password="pw")
+        self.save_image(other, "red")
+        self.assertEqual(self.refs(red), 2)
+
+        # 바꾸면 이전 원본의 참조 해제
+        blue = self.save_image(user, "blue")
+        self.assertEqual(self.refs(red), 1)
+        self.assertEqual(self.refs(blue), 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            other.delete()
+        self.assertEqual(self.refs(red), 0)
+        self.assertFalse(upload_storage().exists(red))
+        self.assertTrue(upload_storage().exists(blue))
@@ -1,5 +1,9 @@
 # main/views.py
-from django.views.generic import TemplateView
+from django.http import Http404, JsonResponse
+from django.template.loader import render_to_string
+from django.views.generic import TemplateView, View
+
+from .fragments import HOLES
 
 
 class HomeView(TemplateView):
@@ -12,3 +16,27 @@ class AboutView(TemplateView):
 
 class ContactView(TemplateView):
     template_name = "main/contact.html"
+
+
+class FragmentView(View):
+    """캐시된 페이지의 사용자별 영역(hole)을 현재 사용자 기준으로 렌더링
+
+    GET /fragments/?holes=nav_user,post_actions&post_id=1
+    """
+
+    def get(self, request):
+        params = request.GET.dict()
+        names = [name for name in params.pop("holes", "").split(",") if name]
+        holes = {}
+        for name in names:
+            if name not in HOLES:
+                raise Http404(f"알 수 없는 영역입니다: {name}")
+            template_name, get_context = HOLES[name]
+            context = get_context(request, params) if get_context else {}
+            holes[name] = render_to_string(template_name, context, request=request)
+        user = request.user
+        response = JsonResponse(
+            {"user_id": user.pk if user.is_authenticated else None, "holes": holes}
+        )
+        response["Cache-Control"] = "private, no-store"
+        return response
@@ -0,0 +1,129 @@
+# main/write_queue.py
+"""쓰기 작업 직렬화 큐
+
+SQLite는 한 번에 하나의 쓰기만 허용하므로, 여러 요청 스레드가 동시에 쓰면
+잠금을 두고 경쟁하다 "database is locked"로 실패하기 쉽습니다.
+이 큐는 프로세스마다 쓰기 전용 스레드 하나가 작업을 받아, 잠깐(batch window)
+모인 작업들을 한 트랜잭션으로 묶어 커밋합니다(group commit).
+요청 스레드는 커밋이 끝날 때까지 기다렸다가 결과를 받습니다.
+"""
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+from django.conf import settings
+from django.db import connection, transaction
+
+logger = logging.getLogger(__name__)
+
+
+class WriteQueue:
+    def __init__(self):
+        self._queue = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def enabled(self):
+        return getattr(settings, "WRITE_QUEUE_ENABLED", True)
+
+    @property
+    def batch_size(self):
+        return getattr(settings, "WRITE_QUEUE_BATCH_SIZE", 100)
+
+    @property
+    def batch_window(self):
+        return getattr(settings, "WRITE_QUEUE_BATCH_WINDOW", 0.002)
+
+    @property
+    def timeout(self):
+        return getattr(settings, "WRITE_QUEUE_TIMEOUT", 10)
+
+    def submit(self, func, *args, **kwargs):
+        """쓰기 작업을 큐에 넣고 Future 반환 (커밋된 뒤에 결과가 채워짐)"""
+        future = Future()
+        if not self.enabled or self._in_writer() or connection.in_atomic_block:
+            # 호출자가 이미 트랜잭션(또는 쓰기 스레드) 안이면 기다리면 교착되므로 바로 실행
+            future.set_running_or_notify_cancel()
+            try:
+                future.set_result(func(*args, **kwargs))
+            except Exception as exc:
+                future.set_exception(exc)
+            return future
+        self._ensure_thread()
+        self._queue.put((future, func, args, kwargs))
+        return future
+
+    def run(self, func, *args, **kwargs):
+        """작업이 커밋될 때까지 기다렸다가 결과 반환 (작업의 예외는 그대로 전달)"""
+        return self.submit(func, *args, **kwargs).result(timeout=self.timeout)
+
+    def _in_writer(self):
+        return threading.current_thread() is self._thread
+
+    def _ensure_thread(self):
+        """쓰기 스레드를 (처음 한 번) 시작"""
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="write-queue", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.batch_window
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    if remaining > 0:
+                        batch.append(self._queue.get(timeout=remaining))
+                    else:
+                        batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            self._commit(batch)
+            try:
+                connection.close_if_unusable_or_obsolete()
+            except Exception:
+                logger.exception("쓰기 스레드 DB 연결 정리 실패")
+
+    def _commit(self, batch):
+        """묶음을 한 트랜잭션으로 실행 (각 작업은 세이브포인트로 분리)"""
+        outcomes = []
+        try:
+            with transaction.atomic():
+                for future, func, args, kwargs in batch:
+                    if not future.set_running_or_notify_cancel():
+                        outcomes.append(None)
+                        continue
+                    try:
+                        with transaction.atomic():
+                            outcomes.append((True, func(*args, **kwargs)))
+                    except Exception as exc:
+                        outcomes.append((False, exc))
+        except Exception as exc:
+            # 커밋 자체가 실패하면 묶음 전체가 반영되지 않음
+            logger.exception("쓰기 묶음 커밋 실패 (%d건)", len(batch))
+            for future, *_ in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for (future, *_), outcome in zip(batch, outcomes):
+            if outcome is None:
+                continue
+            ok, value = outcome
+            if ok:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
+
+
+write_queue = WriteQueue()